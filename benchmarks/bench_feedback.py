@@ -0,0 +1,277 @@
+"""Benchmarks for the feedback command on synthetic rosters.
+
+Generates synthetic rosters and issues, both as an issues directory and as a
+multi-issues file, and times the phases of the feedback command against a
+fake platform API with configurable latency and throttling. Run from the root
+of the repository, for example:
+
+.. code-block:: bash
+
+    $ python -m benchmarks.bench_feedback --sizes 10 1000 100000 --latency 0.01
+
+.. module:: bench_feedback
+    :synopsis: Benchmarks for the feedback command.
+"""
+import argparse
+import contextlib
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+import repobee_plug as plug
+
+from repobee_feedback import feedback
+
+from benchmarks.fake_api import create_fake_api
+
+ASSIGNMENT_NAMES = ("task-1", "task-2")
+BODY_LINES = 20
+
+
+def main(argv: List[str]) -> None:
+    args = _parse_args(argv)
+    print(
+        f"{'repos':>8} {'format':<16} {'phase':<26} "
+        f"{'seconds':>10} {'peak MiB':>10}"
+    )
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            workdir = pathlib.Path(tmpdir)
+            students, repos_and_issues = _generate_roster(size)
+            issues_dir = workdir / "issues"
+            issues_dir.mkdir()
+            _write_issues_dir(repos_and_issues, issues_dir)
+            multi_issues_file = workdir / "issues.md"
+            _write_multi_issues_file(repos_and_issues, multi_issues_file)
+            repo_names = [repo_name for repo_name, _ in repos_and_issues]
+
+            for fmt, read_issues in (
+                (
+                    "issues-dir",
+                    lambda: feedback._collect_issues(
+                        repo_names, issues_dir, workers=args.workers
+                    ),
+                ),
+                (
+                    "multi-issues",
+                    lambda: list(
+                        feedback._parse_multi_issues_file(multi_issues_file)
+                    ),
+                ),
+                (
+                    "multi-issues-par",
+                    lambda: list(
+                        feedback._parse_multi_issues_file(
+                            multi_issues_file, args.processes
+                        )
+                    ),
+                ),
+                (
+                    "issues-dir-lazy",
+                    lambda: feedback._collect_issues(
+                        repo_names, issues_dir, workers=args.workers, lazy=True
+                    ),
+                ),
+            ):
+                _report(size, fmt, "read issues", read_issues)
+                all_issues = read_issues()
+                _report(
+                    size,
+                    fmt,
+                    "_extract_expected_issues",
+                    lambda: feedback._extract_expected_issues(
+                        all_issues, repo_names, allow_missing=False
+                    ),
+                )
+                _report(
+                    size,
+                    fmt,
+                    f"callback ({args.workers} workers)",
+                    lambda: _quietly(
+                        feedback.callback,
+                        _feedback_args(
+                            students,
+                            issues_dir=issues_dir,
+                            multi_issues_file=(
+                                multi_issues_file
+                                if fmt.startswith("multi-issues")
+                                else None
+                            ),
+                            parse_processes=(
+                                args.processes
+                                if fmt == "multi-issues-par"
+                                else 1
+                            ),
+                            workers=args.workers,
+                            rate_limit=args.rate_limit,
+                            lazy_bodies=fmt.endswith("-lazy"),
+                        ),
+                        create_fake_api(
+                            latency=args.latency,
+                            max_requests_per_second=args.throttle,
+                        ),
+                    ),
+                    trace_memory=not args.no_memory,
+                )
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[10, 100, 1000],
+        help="amounts of student repos to benchmark with",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds that each call to the fake platform API takes",
+    )
+    parser.add_argument(
+        "--throttle",
+        type=float,
+        help="requests per second beyond which the fake API throttles",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="worker threads to use"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processes to parse the multi-issues file with in parallel",
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, help="client side rate limit to use"
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="don't trace memory for the full callback, which takes long "
+        "with a high latency as every call is made twice",
+    )
+    return parser.parse_args(argv)
+
+
+def _report(
+    size: int,
+    fmt: str,
+    phase: str,
+    func: Callable[[], Any],
+    trace_memory: bool = True,
+) -> None:
+    seconds, peak = _measure(func, trace_memory)
+    peak_str = f"{peak / 2 ** 20:10.2f}" if peak is not None else f"{'-':>10}"
+    print(f"{size:>8} {fmt:<16} {phase:<26} {seconds:10.4f} {peak_str}")
+
+
+def _quietly(func: Callable[..., Any], *args: Any) -> Any:
+    """Call the function with stdout discarded."""
+    with open(os.devnull, mode="w") as devnull, contextlib.redirect_stdout(
+        devnull
+    ):
+        return func(*args)
+
+
+def _measure(func: Callable[[], Any], trace_memory: bool) -> Tuple[float, Any]:
+    """Time the function, and then run it again with memory tracing, as the
+    tracing itself slows down execution considerably.
+    """
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    if not trace_memory:
+        return seconds, None
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def _generate_roster(
+    num_repos: int,
+) -> Tuple[List[plug.StudentTeam], List[Tuple[str, plug.Issue]]]:
+    num_students = max(1, num_repos // len(ASSIGNMENT_NAMES))
+    students = [
+        plug.StudentTeam(members=[f"student{i}"]) for i in range(num_students)
+    ]
+    repo_names = plug.generate_repo_names(students, ASSIGNMENT_NAMES)
+    body = "\n".join(
+        f"Test case {i}: expected 42 but got {i}" for i in range(BODY_LINES)
+    )
+    return students, [
+        (repo_name, plug.Issue(title=f"Feedback for {repo_name}", body=body))
+        for repo_name in repo_names
+    ]
+
+
+def _write_issues_dir(
+    repos_and_issues: List[Tuple[str, plug.Issue]], issues_dir: pathlib.Path
+) -> None:
+    for repo_name, issue in repos_and_issues:
+        (issues_dir / f"{repo_name}.md").write_text(
+            f"{issue.title}\n{issue.body}", encoding=sys.getdefaultencoding()
+        )
+
+
+def _write_multi_issues_file(
+    repos_and_issues: List[Tuple[str, plug.Issue]], path: pathlib.Path
+) -> None:
+    with open(path, mode="w", encoding=sys.getdefaultencoding()) as file:
+        for repo_name, issue in repos_and_issues:
+            file.write(f"#ISSUE#{repo_name}#{issue.title}\n{issue.body}\n\n")
+
+
+def _feedback_args(
+    students: List[plug.StudentTeam], **kwargs: Any
+) -> argparse.Namespace:
+    args = dict(
+        students=students,
+        assignments=list(ASSIGNMENT_NAMES),
+        batch_mode=True,
+        issues_dir=None,
+        multi_issues_file=None,
+        truncation_length=sys.maxsize,
+        allow_missing=False,
+        workers=1,
+        rate_limit=None,
+        max_retries=10,
+        journal=None,
+        resume=False,
+        skip_existing=False,
+        cache_ttl=0,
+        index_multi_issues_file=False,
+        recursive=False,
+        stats=False,
+        stats_file=None,
+        issues_template=None,
+        template_data=None,
+        issues_jsonl=None,
+        issues_archive=None,
+        shard=None,
+        manifest=None,
+        only_changed=False,
+        watch=False,
+        settle_time=0,
+        lazy_bodies=False,
+        update=False,
+        parse_processes=1,
+    )
+    args.update(kwargs)
+    return argparse.Namespace(**args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,98 @@
+"""Benchmark of the time it takes to import the plugin.
+
+RepoBee imports every activated plugin on every command, so the import time
+of the plugin is paid by all RepoBee invocations, not only by the feedback
+commands. This benchmark imports the plugin in fresh interpreters with
+``python -X importtime``, and reports the time spent importing the plugin's
+own modules, excluding RepoBee itself. Run from the root of the repository,
+for example:
+
+.. code-block:: bash
+
+    $ python -m benchmarks.bench_import --repeat 20 --max-ms 30
+
+With ``--max-ms``, the benchmark fails if the median import time exceeds the
+given amount of milliseconds, such that it can guard against regressions.
+Note that the import time includes compiling the modules if bytecode caching
+is disabled, e.g. with PYTHONDONTWRITEBYTECODE.
+
+.. module:: bench_import
+    :synopsis: Benchmark of the import time of the plugin.
+"""
+import argparse
+import pathlib
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+PLUGIN_MODULE = "repobee_feedback.feedback"
+# RepoBee is imported first, such that only the plugin's own imports are
+# attributed to the plugin
+IMPORT_CODE = f"import repobee_plug; import {PLUGIN_MODULE}"
+IMPORTTIME_REGEX = re.compile(r"import time:\s*\d+ \|\s*(\d+) \|\s*(\S+)")
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def main(argv: List[str]) -> None:
+    args = _parse_args(argv)
+    samples = [_measure_import() for _ in range(args.repeat)]
+
+    cumulative_ms = [sample[PLUGIN_MODULE] / 1000 for sample in samples]
+    median_ms = statistics.median(cumulative_ms)
+    print(
+        f"import {PLUGIN_MODULE}: median {median_ms:.2f} ms, "
+        f"min {min(cumulative_ms):.2f} ms over {args.repeat} runs"
+    )
+    print("plugin modules imported:")
+    for name in sorted(samples[0]):
+        print(f"    {name}")
+
+    if args.max_ms is not None and median_ms > args.max_ms:
+        sys.exit(
+            f"median import time {median_ms:.2f} ms exceeds the maximum of "
+            f"{args.max_ms:.2f} ms"
+        )
+
+
+def _measure_import() -> Dict[str, int]:
+    """Import the plugin in a fresh interpreter.
+
+    Returns:
+        A mapping from the name of each imported plugin module to its
+        cumulative import time in microseconds.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CODE],
+        cwd=str(REPO_ROOT),
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    cumulative_us = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_REGEX.match(line)
+        if match and match.group(2).startswith("repobee_feedback"):
+            cumulative_us[match.group(2)] = int(match.group(1))
+    return cumulative_us
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="amount of fresh interpreters to import the plugin in",
+    )
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        help="fail if the median import time exceeds this many milliseconds",
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
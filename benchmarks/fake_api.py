@@ -0,0 +1,139 @@
+"""A local fake platform API for benchmarking the feedback command.
+
+.. module:: fake_api
+    :synopsis: An in-memory implementation of the platform API that simulates
+        per-call latency and rate limiting, such that the feedback command can
+        be benchmarked without a network.
+"""
+import collections
+import itertools
+import threading
+import time
+from typing import Deque, Dict, Iterable, List, Optional
+
+import repobee_plug as plug
+
+BASE_URL = "https://fake.example.com"
+
+
+class FakePlatformAPI(plug.PlatformAPI):
+    """A platform API in which every student repo exists. Each call sleeps
+    for the configured latency, and calls beyond the configured amount of
+    requests per second are rejected like a secondary rate limit.
+    """
+
+    def __init__(self, base_url, token, org_name, user):
+        self._base_url = base_url
+        self._org_name = org_name
+        self._latency = 0.0
+        self._max_requests_per_second: Optional[float] = None
+        self._request_times: Deque[float] = collections.deque()
+        self._issues: Dict[str, List[plug.Issue]] = collections.defaultdict(
+            list
+        )
+        self._issue_numbers = itertools.count(1)
+        self._lock = threading.Lock()
+        self.call_counts: Dict[str, int] = collections.Counter()
+
+    def get_repo(self, repo_name: str, team_name: Optional[str]) -> plug.Repo:
+        self._request("get_repo")
+        return self._repo(repo_name)
+
+    def get_repos(
+        self, repo_urls: Optional[List[str]] = None
+    ) -> Iterable[plug.Repo]:
+        # like the platforms, the repos are looked up one request at a time
+        repos = []
+        for url in repo_urls or []:
+            self._request("get_repos")
+            repos.append(self._repo(self.extract_repo_name(url)))
+        return repos
+
+    def get_repo_urls(
+        self,
+        assignment_names: Iterable[str],
+        org_name: Optional[str] = None,
+        team_names: Optional[List[str]] = None,
+        insert_auth: bool = False,
+    ) -> List[str]:
+        repo_names = (
+            plug.generate_repo_names(team_names, assignment_names)
+            if team_names
+            else assignment_names
+        )
+        return [
+            f"{self._base_url}/{org_name or self._org_name}/{repo_name}"
+            for repo_name in repo_names
+        ]
+
+    def extract_repo_name(self, repo_url: str) -> str:
+        return repo_url.rsplit("/", 1)[-1]
+
+    def create_issue(
+        self,
+        title: str,
+        body: str,
+        repo: plug.Repo,
+        assignees: Optional[Iterable[str]] = None,
+    ) -> plug.Issue:
+        self._request("create_issue")
+        issue = plug.Issue(
+            title=title,
+            body=body,
+            number=next(self._issue_numbers),
+            state=plug.IssueState.OPEN,
+        )
+        with self._lock:
+            self._issues[repo.name].append(issue)
+        return issue
+
+    def get_repo_issues(self, repo: plug.Repo) -> Iterable[plug.Issue]:
+        self._request("get_repo_issues")
+        with self._lock:
+            return list(self._issues[repo.name])
+
+    def _repo(self, repo_name: str) -> plug.Repo:
+        return plug.Repo(
+            name=repo_name,
+            description="",
+            private=True,
+            url=f"{self._base_url}/{self._org_name}/{repo_name}",
+            implementation=None,
+        )
+
+    def _request(self, method_name: str) -> None:
+        with self._lock:
+            self.call_counts[method_name] += 1
+            if self._max_requests_per_second is not None:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] > 1:
+                    self._request_times.popleft()
+                if len(self._request_times) >= self._max_requests_per_second:
+                    raise plug.PlatformError(
+                        "You have exceeded a secondary rate limit",
+                        status=403,
+                    )
+                self._request_times.append(now)
+
+        time.sleep(self._latency)
+
+
+def create_fake_api(
+    latency: float = 0.0,
+    max_requests_per_second: Optional[float] = None,
+    org_name: str = "fake-org",
+) -> FakePlatformAPI:
+    """Create a fake platform API.
+
+    Args:
+        latency: Seconds that each API call takes.
+        max_requests_per_second: Requests per second beyond which calls are
+            throttled. Defaults to no throttling.
+        org_name: Name of the target organization.
+    Returns:
+        A fake platform API.
+    """
+    api = FakePlatformAPI(BASE_URL, "fake-token", org_name, "fake-user")
+    api._latency = latency
+    api._max_requests_per_second = max_requests_per_second
+    return api
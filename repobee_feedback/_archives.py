@@ -0,0 +1,88 @@
+"""Reading of issue files straight from tar and zip archives.
+
+.. module:: _archives
+    :synopsis: Reads issue files named <STUDENT_REPO_NAME>.md from tar or zip
+        archives, without extracting them to disk.
+"""
+import io
+import pathlib
+import posixpath
+import sys
+import tarfile
+import zipfile
+from typing import IO, Iterable, Iterator, Optional, Set, Tuple
+
+import repobee_plug as plug
+
+
+def read_archive_issues(
+    archive: pathlib.Path, repo_names: Iterable[str]
+) -> Iterator[Tuple[str, plug.Issue]]:
+    """Lazily read the issue files of the given repos from a tar archive
+    (optionally compressed) or a zip archive. Issue files may be located in
+    any directory of the archive. Tar archives are read in a single
+    streaming pass, and only the members of expected repos are decoded.
+
+    Args:
+        archive: Path to an archive.
+        repo_names: Names of the repos to read issues for.
+    Returns:
+        Pairs of repo name and issue, in archive order.
+    """
+    expected_repo_names = set(repo_names)
+    if zipfile.is_zipfile(archive):
+        issues = _read_zip_issues(archive, expected_repo_names)
+    elif tarfile.is_tarfile(str(archive)):
+        issues = _read_tar_issues(archive, expected_repo_names)
+    else:
+        raise plug.PlugError(f"{archive} is not a tar or zip archive")
+
+    found: Set[str] = set()
+    for repo_name, issue in issues:
+        if repo_name in found:
+            raise plug.PlugError(
+                f"Found multiple issue files for {repo_name} in {archive}"
+            )
+        found.add(repo_name)
+        yield repo_name, issue
+
+
+def _read_zip_issues(
+    archive: pathlib.Path, expected_repo_names: Set[str]
+) -> Iterator[Tuple[str, plug.Issue]]:
+    with zipfile.ZipFile(str(archive)) as zip_file:
+        for info in zip_file.infolist():
+            repo_name = _repo_name(info.filename, expected_repo_names)
+            if repo_name is None or info.is_dir():
+                continue
+            with zip_file.open(info) as member:
+                yield repo_name, _read_issue(member)
+
+
+def _read_tar_issues(
+    archive: pathlib.Path, expected_repo_names: Set[str]
+) -> Iterator[Tuple[str, plug.Issue]]:
+    with tarfile.open(str(archive), mode="r|*") as tar_file:
+        for info in tar_file:
+            repo_name = _repo_name(info.name, expected_repo_names)
+            if repo_name is None or not info.isfile():
+                continue
+            member = tar_file.extractfile(info)
+            assert member
+            yield repo_name, _read_issue(member)
+
+
+def _repo_name(
+    member_name: str, expected_repo_names: Set[str]
+) -> Optional[str]:
+    repo_name, ext = posixpath.splitext(posixpath.basename(member_name))
+    if ext != ".md" or repo_name not in expected_repo_names:
+        return None
+    return repo_name
+
+
+def _read_issue(member: IO[bytes]) -> plug.Issue:
+    text = member.read().decode(sys.getdefaultencoding())
+    # translate newlines the same way as reading an issue file does
+    file = io.StringIO(text, newline=None)
+    return plug.Issue(file.readline().strip(), file.read())
@@ -0,0 +1,132 @@
+"""A small on-disk cache that persists data between invocations.
+
+.. module:: _cache
+    :synopsis: A JSON file backed key-value cache in which entries expire
+        after a configurable time to live.
+"""
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional, Set
+
+import repobee_plug as plug
+
+CACHE_ENCODING = "utf8"
+
+
+def cache_dir() -> pathlib.Path:
+    """Return the directory in which the plugin stores its caches, following
+    the XDG base directory specification.
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base_dir = (
+        pathlib.Path(xdg_cache_home)
+        if xdg_cache_home
+        else pathlib.Path.home() / ".cache"
+    )
+    return base_dir / "repobee-feedback"
+
+
+def write_atomically(path: pathlib.Path, content: str, encoding: str) -> None:
+    """Write the content to the file through a unique temporary file, such
+    that readers never see a partially written file, and concurrent writers
+    don't write to or replace each other's temporary files.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        encoding=encoding,
+        dir=str(path.parent),
+        prefix=path.name,
+        suffix=".tmp",
+        delete=False,
+    ) as tmp_file:
+        tmp_file.write(content)
+    try:
+        os.replace(tmp_file.name, path)
+    except OSError:
+        os.unlink(tmp_file.name)
+        raise
+
+
+class JsonCache:
+    """A key-value cache stored as a single JSON file. Entries older than the
+    time to live are treated as absent. Changes are only written to disk on
+    :py:meth:`save`, which merges them into the entries on disk, such that
+    concurrent invocations sharing the cache keep each other's entries.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._path = path
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        # keys put or invalidated since the cache was loaded
+        self._changed_keys: Set[str] = set()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under the key, or None if there is no
+        such value or it has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or self._clock() - entry["stored_at"] > self._ttl:
+            return None
+        return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = dict(stored_at=self._clock(), value=value)
+            self._changed_keys.add(key)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._changed_keys.add(key)
+
+    def save(self) -> None:
+        """Merge the changed entries into the entries on disk, and write the
+        unexpired entries back atomically.
+        """
+        now = self._clock()
+        with self._lock:
+            # other invocations may have saved entries since this cache was
+            # loaded
+            entries = self._load()
+            for key in self._changed_keys:
+                if key in self._entries:
+                    entries[key] = self._entries[key]
+                else:
+                    entries.pop(key, None)
+            self._entries = {
+                key: entry
+                for key, entry in entries.items()
+                if now - entry["stored_at"] <= self._ttl
+            }
+            self._changed_keys.clear()
+            content = json.dumps(self._entries)
+
+        try:
+            write_atomically(self._path, content, CACHE_ENCODING)
+        except OSError as exc:
+            # the cache only saves time, so failing to write it must not fail
+            # the run that saves it
+            plug.log.warning(f"Failed to write cache file {self._path}: {exc}")
+
+    def _load(self) -> dict:
+        if not self._path.is_file():
+            return {}
+        try:
+            return json.loads(self._path.read_text(encoding=CACHE_ENCODING))
+        except ValueError:
+            plug.log.warning(f"Ignoring corrupt cache file {self._path}")
+            return {}
@@ -0,0 +1,148 @@
+"""Parallel parsing of large multi-issues files.
+
+.. module:: _chunked_parsing
+    :synopsis: Splits a multi-issues file into byte ranges that each start
+        with an #ISSUE# line, and parses the ranges in separate processes,
+        such that parsing scales with the amount of cores.
+"""
+import concurrent.futures
+import pathlib
+import sys
+from typing import (
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Match,
+    Optional,
+    Tuple,
+)
+
+import repobee_plug as plug
+
+# chunks smaller than this aren't worth the overhead of a process
+MIN_CHUNK_SIZE = 1 << 20
+# more chunks than processes evens out chunks that parse at different speeds
+CHUNKS_PER_PROCESS = 4
+
+
+def parse_in_chunks(
+    issues_file: pathlib.Path,
+    processes: int,
+    match_begin_issue: Callable[[str], Optional[Match[str]]],
+    parse_chunk: Callable[
+        [pathlib.Path, int, int], List[Tuple[str, str, str]]
+    ],
+    min_chunk_size: int = MIN_CHUNK_SIZE,
+) -> Iterator[Tuple[str, plug.Issue]]:
+    """Parse the multi-issues file in chunks on a pool of processes, yielding
+    the issues in file order.
+
+    Args:
+        issues_file: Path to a multi-issues file.
+        processes: Amount of processes to parse chunks in.
+        match_begin_issue: A function that matches a line that begins an
+            issue block, and captures its repo name and title.
+        parse_chunk: A function that parses the repo name, title and body
+            of each issue in a byte range of the file that starts with an
+            issue block. Must be picklable, i.e. defined at the top level of
+            a module.
+        min_chunk_size: Smallest amount of bytes to parse in a chunk.
+    """
+    chunks = split_into_chunks(
+        issues_file,
+        processes * CHUNKS_PER_PROCESS,
+        match_begin_issue,
+        min_chunk_size,
+    )
+    if len(chunks) == 1:
+        # not worth the overhead of starting processes
+        start, end = chunks[0]
+        yield from _create_issues([parse_chunk(issues_file, start, end)])
+        return
+
+    starts, ends = zip(*chunks)
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(processes, len(chunks))
+    ) as executor:
+        yield from _create_issues(
+            executor.map(
+                parse_chunk, [issues_file] * len(chunks), starts, ends
+            )
+        )
+
+
+def split_into_chunks(
+    issues_file: pathlib.Path,
+    num_chunks: int,
+    match_begin_issue: Callable[[str], Optional[Match[str]]],
+    min_chunk_size: int = MIN_CHUNK_SIZE,
+) -> List[Tuple[int, int]]:
+    """Split the multi-issues file into at most the given amount of byte
+    ranges of roughly equal size. Each range is snapped forward to the next
+    #ISSUE# line, so that no issue block is split across ranges.
+
+    Returns:
+        The start and end offsets of the ranges, in file order.
+    """
+    size = issues_file.stat().st_size
+    num_chunks = max(1, min(num_chunks, size // max(min_chunk_size, 1)))
+    starts = [0]
+    with open(str(issues_file), mode="rb") as file:
+        if size > 0 and not _is_begin_issue(
+            file.readline(), match_begin_issue
+        ):
+            raise plug.PlugError(
+                "first line of multi issues file not #ISSUE# line"
+            )
+
+        for i in range(1, num_chunks):
+            offset = max(size * i // num_chunks, starts[-1] + 1)
+            start = _next_begin_issue_offset(file, offset, match_begin_issue)
+            if start is None:
+                break
+            starts.append(start)
+
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _next_begin_issue_offset(
+    file: BinaryIO,
+    offset: int,
+    match_begin_issue: Callable[[str], Optional[Match[str]]],
+) -> Optional[int]:
+    """Return the offset of the first #ISSUE# line that starts at or after
+    the given offset, or None if there is no such line.
+    """
+    # a line starts after a newline, so the line containing the byte before
+    # the offset is skipped
+    file.seek(offset - 1)
+    file.readline()
+    while True:
+        line_start = file.tell()
+        line = file.readline()
+        if not line:
+            return None
+        if _is_begin_issue(line, match_begin_issue):
+            return line_start
+
+
+def _is_begin_issue(
+    line: bytes, match_begin_issue: Callable[[str], Optional[Match[str]]]
+) -> bool:
+    return line.startswith(b"#") and bool(
+        match_begin_issue(
+            line.decode(sys.getdefaultencoding(), errors="replace")
+        )
+    )
+
+
+def _create_issues(
+    parsed_chunks: Iterable[List[Tuple[str, str, str]]],
+) -> Iterator[Tuple[str, plug.Issue]]:
+    # chunks are parsed into plain tuples, as those are several times
+    # cheaper to send between processes than issues
+    for parsed_chunk in parsed_chunks:
+        for repo_name, title, body in parsed_chunk:
+            yield repo_name, plug.Issue(title=title, body=body)
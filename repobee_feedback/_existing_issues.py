@@ -0,0 +1,92 @@
+"""An index of the issues that already exist in student repos.
+
+.. module:: _existing_issues
+    :synopsis: Fetches the existing issues of student repos concurrently and
+        indexes them by digest, such that duplicate feedback issues can be
+        skipped.
+"""
+import collections
+import concurrent.futures
+from typing import Callable, DefaultDict, Iterable, Optional, Set
+
+import repobee_plug as plug
+
+from repobee_feedback._cache import JsonCache
+from repobee_feedback._journal import normalized_issue_digest
+
+
+class ExistingIssues:
+    """Digests of the title and body of the issues in each repo. The digests
+    of each repo are cached, such that back-to-back runs don't need to fetch
+    them again.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[JsonCache] = None,
+        cache_key: Callable[[str], str] = str,
+    ):
+        self._cache = cache
+        self._cache_key = cache_key
+        self._digests: DefaultDict[str, Set[str]] = collections.defaultdict(
+            set
+        )
+
+    def fetch(
+        self,
+        repo_names: Iterable[str],
+        get_repo_issues: Callable[[str], Iterable[plug.Issue]],
+        workers: int,
+    ) -> None:
+        """Fetch the issues of all repos that are not in the cache.
+
+        Args:
+            repo_names: Names of the repos to fetch issues from.
+            get_repo_issues: A function that fetches the issues of a repo.
+            workers: Amount of repos to fetch issues from concurrently.
+        """
+        to_fetch = []
+        for repo_name in repo_names:
+            cached = self._cache_get(repo_name)
+            if cached is None:
+                to_fetch.append(repo_name)
+            else:
+                self._digests[repo_name] = cached
+
+        def fetch_digests(repo_name: str) -> Set[str]:
+            issues = get_repo_issues(repo_name)
+            return {normalized_issue_digest(issue) for issue in issues}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            for repo_name, digests in zip(
+                to_fetch, executor.map(fetch_digests, to_fetch)
+            ):
+                self._digests[repo_name] = digests
+                self._cache_put(repo_name)
+
+    def contains(self, repo_name: str, issue: plug.Issue) -> bool:
+        return normalized_issue_digest(issue) in self._digests[repo_name]
+
+    def add(self, repo_name: str, issue: plug.Issue) -> None:
+        """Record that the issue now exists in the repo."""
+        self._digests[repo_name].add(normalized_issue_digest(issue))
+        self._cache_put(repo_name)
+
+    def save(self) -> None:
+        if self._cache is not None:
+            self._cache.save()
+
+    def _cache_get(self, repo_name: str) -> Optional[Set[str]]:
+        if self._cache is None:
+            return None
+        cached = self._cache.get(self._cache_key(repo_name))
+        return set(cached) if cached is not None else None
+
+    def _cache_put(self, repo_name: str) -> None:
+        if self._cache is not None:
+            self._cache.put(
+                self._cache_key(repo_name),
+                sorted(self._digests[repo_name]),
+            )
@@ -10,7 +10,7 @@ wich contains templates of issues for multiple students assignments.
 """
 import pathlib
 import sys
-from typing import List
+from typing import Iterable
 
 import repobee_plug as plug
 from repobee_plug.cli.categorization import Action
@@ -38,25 +38,51 @@ class GenerateMultiIssuesFile(plug.Plugin, plug.cli.Command):
         base_parsers=[plug.BaseParser.ASSIGNMENTS, plug.BaseParser.STUDENTS],
     )
 
-    def command(self):
-        content = _generate_multi_issues_file_content(
-            self.args.students, self.args.assignments
-        )
-
-        pathlib.Path(MULTI_ISSUES_FILENAME).write_text(
-            content, encoding=sys.getdefaultencoding()
+    output = plug.cli.option(
+        help="path to write the multi-issues file to",
+        converter=pathlib.Path,
+        default=MULTI_ISSUES_FILENAME,
+    )
+    per_assignment = plug.cli.flag(
+        help=(
+            "write one multi-issues file per assignment, named "
+            "<OUTPUT_STEM>-<ASSIGNMENT><OUTPUT_SUFFIX>"
         )
+    )
 
-        plug.echo(f"Created multi-issues file '{MULTI_ISSUES_FILENAME}'")
-
+    def command(self):
+        output = pathlib.Path(self.args.output)
+        if self.args.per_assignment:
+            outputs = [
+                (
+                    output.with_name(
+                        f"{output.stem}-{assignment}{output.suffix}"
+                    ),
+                    [assignment],
+                )
+                for assignment in self.args.assignments
+            ]
+        else:
+            outputs = [(output, self.args.assignments)]
 
-def _generate_multi_issues_file_content(
-    students: List[str], assignments: List[str]
-) -> str:
+        for path, assignments in outputs:
+            _write_multi_issues_file(
+                plug.generate_repo_names(self.args.students, assignments),
+                path,
+            )
+            plug.echo(f"Created multi-issues file '{path}'")
 
-    issue_headers = [
-        f"#ISSUE#{repo_name}#<ISSUE-TITLE>\n<ISSUE-BODY>"
-        for repo_name in plug.generate_repo_names(students, assignments)
-    ]
 
-    return "\n\n".join(issue_headers)
+def _write_multi_issues_file(
+    repo_names: Iterable[str], path: pathlib.Path
+) -> None:
+    """Stream issue headers for the given repos to the multi-issues file, one
+    at a time, such that the content is never held in memory as a whole.
+    """
+    with open(str(path), mode="w", encoding=sys.getdefaultencoding()) as file:
+        separator = ""
+        for repo_name in repo_names:
+            file.write(
+                f"{separator}#ISSUE#{repo_name}#<ISSUE-TITLE>\n<ISSUE-BODY>"
+            )
+            separator = "\n\n"
@@ -0,0 +1,117 @@
+"""An on-disk journal of opened feedback issues, used to resume runs.
+
+.. module:: _journal
+    :synopsis: Append-only journal of the feedback issues that have been
+        opened, such that interrupted runs can be resumed without opening
+        duplicate issues.
+"""
+import dataclasses
+import hashlib
+import json
+import pathlib
+import threading
+from typing import Iterable, List, Optional, Set, Tuple
+
+import repobee_plug as plug
+
+JOURNAL_ENCODING = "utf8"
+
+
+def issue_digest(issue: plug.Issue) -> str:
+    """Compute a digest of the title and body of an issue."""
+    content = f"{issue.title}\n{issue.body}"
+    return hashlib.sha256(content.encode(JOURNAL_ENCODING)).hexdigest()
+
+
+def normalized_issue_digest(issue: plug.Issue) -> str:
+    """Compute a digest of the title and body of an issue that is the same
+    for an issue as it was created and as it's returned by the platform.
+    """
+    return issue_digest(
+        plug.Issue(title=issue.title.strip(), body=normalize_body(issue.body))
+    )
+
+
+def normalize_body(body: str) -> str:
+    """Normalize the line endings and trailing whitespace of an issue body,
+    which platforms may return differently than the body was created with.
+    """
+    return body.replace("\r\n", "\n").rstrip()
+
+
+@dataclasses.dataclass(frozen=True)
+class JournalEntry:
+    """A single opened issue."""
+
+    repo_name: str
+    digest: str
+    number: Optional[int]
+
+
+class Journal:
+    """A journal file with one JSON object per line, each describing an issue
+    that has been opened. Appending is thread safe, and each entry is flushed
+    to disk as soon as it's written.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self._path = path
+        self._lock = threading.Lock()
+
+    def read(self) -> List[JournalEntry]:
+        """Read all entries in the journal. A missing journal is considered
+        empty, and a partially written last line (e.g. from a crash in the
+        middle of a write) is ignored.
+        """
+        if not self._path.is_file():
+            return []
+
+        entries = []
+        with open(self._path, mode="r", encoding=JOURNAL_ENCODING) as file:
+            for line in file:
+                try:
+                    entries.append(JournalEntry(**json.loads(line)))
+                except (ValueError, TypeError):
+                    plug.log.warning(
+                        f"Ignoring malformed journal entry in {self._path}: "
+                        f"{line.strip()}"
+                    )
+        return entries
+
+    def completed(self) -> Set[Tuple[str, str]]:
+        """Return the (repo_name, digest) pairs of all journaled issues."""
+        return {(entry.repo_name, entry.digest) for entry in self.read()}
+
+    def append(
+        self, repo_name: str, issue: plug.Issue, number: Optional[int]
+    ) -> None:
+        """Record that the issue has been opened in the given repo."""
+        self.extend([JournalEntry(repo_name, issue_digest(issue), number)])
+
+    def extend(self, entries: Iterable[JournalEntry]) -> None:
+        """Append the given entries to the journal."""
+        lines = "".join(
+            json.dumps(dataclasses.asdict(entry)) + "\n" for entry in entries
+        )
+        with self._lock, open(
+            self._path, mode="a", encoding=JOURNAL_ENCODING
+        ) as file:
+            file.write(lines)
+
+
+def merge_journals(journals: Iterable[Journal], output: Journal) -> int:
+    """Append the entries of the given journals to the output journal,
+    skipping entries that are already in it, e.g. from a previous merge.
+
+    Returns:
+        The number of appended entries.
+    """
+    seen = set(output.read())
+    new_entries = []
+    for journal in journals:
+        for entry in journal.read():
+            if entry not in seen:
+                seen.add(entry)
+                new_entries.append(entry)
+    output.extend(new_entries)
+    return len(new_entries)
@@ -0,0 +1,60 @@
+"""Streaming reader for issues in the JSON lines format.
+
+.. module:: _jsonl_issues
+    :synopsis: Reads issues from a JSON lines file with one issue object per
+        line, which can carry metadata such as assignees.
+"""
+import dataclasses
+import json
+import pathlib
+import sys
+from typing import Iterator, List, Optional, Tuple
+
+import repobee_plug as plug
+
+
+@dataclasses.dataclass
+class FeedbackIssue(plug.Issue):
+    """An issue with metadata to apply when it's opened."""
+
+    assignees: Optional[List[str]] = None
+
+
+def read_jsonl_issues(
+    issues_file: pathlib.Path,
+) -> Iterator[Tuple[str, FeedbackIssue]]:
+    """Lazily read issues from a JSON lines file. Each non-empty line must be
+    an object with the string keys ``repo_name`` and ``title``, and may have
+    a string ``body`` and a list of ``assignees``. Other keys are ignored.
+
+    Args:
+        issues_file: Path to a JSON lines file.
+    Returns:
+        Pairs of repo name and issue, in file order.
+    """
+    with open(
+        str(issues_file), mode="r", encoding=sys.getdefaultencoding()
+    ) as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+
+            try:
+                obj = json.loads(line)
+                repo_name, issue = obj["repo_name"], _to_issue(obj)
+            except (ValueError, KeyError, TypeError) as exc:
+                raise plug.PlugError(
+                    f"{issues_file}:{line_number}: malformed issue: {exc!r}"
+                ) from exc
+            yield repo_name, issue
+
+
+def _to_issue(obj: dict) -> FeedbackIssue:
+    title = obj["title"]
+    body = obj.get("body", "")
+    assignees = obj.get("assignees")
+    if not all(isinstance(s, str) for s in (obj["repo_name"], title, body)):
+        raise TypeError("repo_name, title and body must be strings")
+    if assignees is not None and not isinstance(assignees, list):
+        raise TypeError("assignees must be a list")
+    return FeedbackIssue(title=title, body=body, assignees=assignees)
@@ -0,0 +1,69 @@
+"""Issues that keep only their titles in memory.
+
+.. module:: _lazy_issues
+    :synopsis: Issues whose bodies are read from disk each time they are
+        accessed, such that memory use doesn't grow with the size of the
+        bodies of all issues in a run.
+"""
+import functools
+import pathlib
+import sys
+from typing import Callable, cast
+
+import repobee_plug as plug
+
+
+class LazyIssue:
+    """An issue that keeps only its title in memory, and reads its body from
+    disk each time it's accessed. Accessing the body is therefore relatively
+    expensive, and code that needs the body several times should keep it in
+    a local variable, or load the full issue with :py:meth:`load`.
+
+    It's not a :py:class:`repobee_plug.Issue`, but only provides the title
+    and body that issues are read, filtered and reviewed by. Lazy issues are
+    equal only to themselves, and their representation omits the body, such
+    that neither reads the body.
+    """
+
+    __slots__ = ("title", "_load_body")
+
+    def __init__(self, title: str, load_body: Callable[[], str]):
+        self.title = title
+        self._load_body = load_body
+
+    @property
+    def body(self) -> str:
+        return self._load_body()
+
+    def load(self) -> plug.Issue:
+        """Return the issue with its body loaded."""
+        return plug.Issue(title=self.title, body=self.body)
+
+    def __repr__(self) -> str:
+        return f"LazyIssue(title={self.title!r})"
+
+
+def lazy_issue(title: str, load_body: Callable[[], str]) -> plug.Issue:
+    """Create a lazy issue to use in place of an issue. Issues are only read,
+    filtered and reviewed by their titles and bodies before they are opened,
+    at which point lazy issues are loaded with :py:meth:`LazyIssue.load`.
+    """
+    return cast(plug.Issue, LazyIssue(title, load_body))
+
+
+def lazy_issue_file(issue_path: pathlib.Path) -> plug.Issue:
+    """Read the title of an issue file, which is its first line. The rest of
+    the file is the body, which is read on access.
+    """
+    with open(str(issue_path), "r", encoding=sys.getdefaultencoding()) as file:
+        title = file.readline().strip()
+        body_position = file.tell()
+    return lazy_issue(
+        title, functools.partial(_read_body, issue_path, body_position)
+    )
+
+
+def _read_body(issue_path: pathlib.Path, body_position: int) -> str:
+    with open(str(issue_path), "r", encoding=sys.getdefaultencoding()) as file:
+        file.seek(body_position)
+        return file.read()
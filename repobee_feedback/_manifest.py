@@ -0,0 +1,132 @@
+"""A manifest of the feedback issues opened in previous runs.
+
+.. module:: _manifest
+    :synopsis: Maps each repo name to a digest of the last issue opened in it,
+        and the size and modification time of its issue file, such that only
+        new or changed issues need to be opened in later rounds.
+"""
+import dataclasses
+import json
+import pathlib
+import threading
+from typing import Dict, Optional, Set
+
+import repobee_plug as plug
+
+from repobee_feedback._cache import write_atomically
+from repobee_feedback._journal import issue_digest
+
+MANIFEST_ENCODING = "utf8"
+
+
+@dataclasses.dataclass(frozen=True)
+class FileStat:
+    """The size and modification time of an issue file."""
+
+    mtime_ns: int
+    size: int
+
+    @staticmethod
+    def of(path: pathlib.Path) -> "FileStat":
+        stat = path.stat()
+        return FileStat(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+
+
+@dataclasses.dataclass(frozen=True)
+class ManifestEntry:
+    """The last issue opened in a repo, and the stat of its issue file at the
+    time it was read, if it was read from an issue file.
+    """
+
+    digest: str
+    file_stat: Optional[FileStat] = None
+
+
+class Manifest:
+    """A manifest stored as a JSON file, mapping repo names to the last issue
+    opened in them. Recording is thread safe, and changes are only written to
+    disk on :py:meth:`save`, which merges them into the entries on disk, such
+    that concurrent runs sharing the manifest keep each other's entries.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        # repos recorded since the manifest was loaded
+        self._recorded_repo_names: Set[str] = set()
+
+    def is_unchanged_file(self, repo_name: str, file_stat: FileStat) -> bool:
+        """Cheaply check if the issue file of the repo is unchanged since the
+        last issue was opened from it, without reading the file.
+        """
+        entry = self._entries.get(repo_name)
+        return entry is not None and entry.file_stat == file_stat
+
+    def is_unchanged(self, repo_name: str, issue: plug.Issue) -> bool:
+        """Check if the issue is the last issue opened in the repo."""
+        entry = self._entries.get(repo_name)
+        return entry is not None and entry.digest == issue_digest(issue)
+
+    def record(
+        self,
+        repo_name: str,
+        issue: plug.Issue,
+        file_stat: Optional[FileStat] = None,
+    ) -> None:
+        """Record that the issue has been opened in the repo.
+
+        Args:
+            repo_name: Name of the repo.
+            issue: The opened issue.
+            file_stat: Stat of the issue file, taken before it was read.
+        """
+        entry = ManifestEntry(issue_digest(issue), file_stat)
+        with self._lock:
+            self._entries[repo_name] = entry
+            self._recorded_repo_names.add(repo_name)
+
+    def save(self) -> None:
+        """Merge the recorded entries into the entries on disk, and write
+        them back atomically.
+        """
+        with self._lock:
+            # other runs may have saved entries since this manifest was
+            # loaded
+            entries = self._load()
+            for repo_name in self._recorded_repo_names:
+                entries[repo_name] = self._entries[repo_name]
+            self._entries = entries
+            self._recorded_repo_names.clear()
+            content = json.dumps(
+                {
+                    repo_name: dataclasses.asdict(entry)
+                    for repo_name, entry in entries.items()
+                },
+                indent=2,
+            )
+
+        write_atomically(self._path, content, MANIFEST_ENCODING)
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        if not self._path.is_file():
+            return {}
+        try:
+            entries = json.loads(
+                self._path.read_text(encoding=MANIFEST_ENCODING)
+            )
+            return {
+                repo_name: ManifestEntry(
+                    digest=entry["digest"],
+                    file_stat=(
+                        FileStat(**entry["file_stat"])
+                        if entry.get("file_stat")
+                        else None
+                    ),
+                )
+                for repo_name, entry in entries.items()
+            }
+        except (ValueError, KeyError, TypeError) as exc:
+            raise plug.PlugError(
+                f"malformed manifest {self._path}: {exc!r}"
+            ) from exc
@@ -0,0 +1,80 @@
+"""A helper command that merges the journals and statistics of several
+feedback runs, such as the shards of a sharded run, into a single report.
+
+.. module:: _merge_reports
+    :synopsis: A helper command that merges the journals and statistics of
+        several feedback runs into a single report.
+"""
+import pathlib
+
+import repobee_plug as plug
+from repobee_plug.cli.categorization import Action
+
+MERGE_FEEDBACK_REPORTS_ACTION = Action(
+    name="merge-feedback-reports",
+    category=plug.cli.CoreCommand.issues,
+)
+
+
+class MergeFeedbackReports(plug.Plugin, plug.cli.Command):
+    __settings__ = plug.cli.command_settings(
+        help="merge the journals and stats of several `issues feedback` runs",
+        description="Merge the journals and statistics files written by "
+        "several runs of the `issues feedback` command, e.g. one run per "
+        "shard with --shard, into a single journal and statistics report.",
+        action=MERGE_FEEDBACK_REPORTS_ACTION,
+    )
+
+    journals = plug.cli.option(
+        help="journals to merge",
+        converter=pathlib.Path,
+        argparse_kwargs=dict(nargs="+"),
+    )
+    output_journal = plug.cli.option(
+        help=(
+            "journal to append the merged entries to, entries that are "
+            "already in it are skipped"
+        ),
+        converter=pathlib.Path,
+    )
+    stats_files = plug.cli.option(
+        help="statistics files to merge, as written with --stats-file",
+        converter=pathlib.Path,
+        argparse_kwargs=dict(nargs="+"),
+    )
+    output_stats_file = plug.cli.option(
+        help="file to write the merged statistics to",
+        converter=pathlib.Path,
+    )
+
+    def command(self):
+        from repobee_feedback._journal import Journal, merge_journals
+        from repobee_feedback._stats import (
+            format_summary,
+            merge_stats,
+            read_stats,
+            write_stats,
+        )
+
+        if not self.args.journals and not self.args.stats_files:
+            raise plug.PlugError(
+                "nothing to merge, specify --journals and/or --stats-files"
+            )
+
+        if self.args.journals:
+            if self.args.output_journal is None:
+                raise plug.PlugError("--journals requires --output-journal")
+            num_entries = merge_journals(
+                map(Journal, self.args.journals),
+                Journal(self.args.output_journal),
+            )
+            plug.echo(
+                f"Merged {num_entries} journal entries into "
+                f"'{self.args.output_journal}'"
+            )
+
+        if self.args.stats_files:
+            stats = merge_stats(map(read_stats, self.args.stats_files))
+            plug.echo(format_summary(stats))
+            if self.args.output_stats_file is not None:
+                write_stats(stats, self.args.output_stats_file)
@@ -0,0 +1,117 @@
+"""A byte offset index of the issue blocks in a multi-issues file.
+
+.. module:: _multi_issues_index
+    :synopsis: Maps the repo name of each issue block in a multi-issues file
+        to the block's byte range, such that single issues can be read
+        without parsing the whole file.
+"""
+import dataclasses
+import hashlib
+import json
+import pathlib
+import sys
+from typing import Callable, List, Match, Optional
+
+import repobee_plug as plug
+
+from repobee_feedback._cache import CACHE_ENCODING, cache_dir
+
+INDEX_DIRNAME = "multi_issues_index"
+
+
+@dataclasses.dataclass(frozen=True)
+class IssueBlock:
+    """The byte range of an issue block, starting with its #ISSUE# line."""
+
+    repo_name: str
+    offset: int
+    length: int
+
+
+def load_index(
+    issues_file: pathlib.Path,
+    match_begin_issue: Callable[[str], Optional[Match[str]]],
+) -> List[IssueBlock]:
+    """Load the index of the multi-issues file, or build it if there is no
+    index or the file has changed since the index was built.
+
+    Args:
+        issues_file: Path to a multi-issues file.
+        match_begin_issue: A function that matches a line that begins an
+            issue block, and captures its repo name and title.
+    Returns:
+        The issue blocks of the file, in file order.
+    """
+    stat = issues_file.stat()
+    index_path = _index_path(issues_file)
+    if index_path.is_file():
+        try:
+            index = json.loads(index_path.read_text(encoding=CACHE_ENCODING))
+            if (index["mtime_ns"], index["size"]) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                return [IssueBlock(*block) for block in index["blocks"]]
+        except (ValueError, KeyError, TypeError):
+            plug.log.warning(f"Ignoring corrupt index file {index_path}")
+
+    blocks = build_index(issues_file, match_begin_issue)
+    index = dict(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        blocks=[dataclasses.astuple(block) for block in blocks],
+    )
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(json.dumps(index), encoding=CACHE_ENCODING)
+    return blocks
+
+
+def build_index(
+    issues_file: pathlib.Path,
+    match_begin_issue: Callable[[str], Optional[Match[str]]],
+) -> List[IssueBlock]:
+    """Scan the multi-issues file for the byte ranges of its issue blocks.
+
+    Args:
+        issues_file: Path to a multi-issues file.
+        match_begin_issue: A function that matches a line that begins an
+            issue block, and captures its repo name and title.
+    Returns:
+        The issue blocks of the file, in file order.
+    """
+    encoding = sys.getdefaultencoding()
+    blocks = []
+    offset = 0
+    block_start: Optional[int] = None
+    repo_name = ""
+    with open(str(issues_file), mode="rb") as file:
+        for line in file:
+            match = line.startswith(b"#") and match_begin_issue(
+                line.decode(encoding, errors="replace")
+            )
+            if match:
+                if block_start is not None:
+                    blocks.append(
+                        IssueBlock(
+                            repo_name, block_start, offset - block_start
+                        )
+                    )
+                repo_name, block_start = match.group(1), offset
+            elif block_start is None:
+                # the first line is not an issue line
+                break
+            offset += len(line)
+
+    if block_start is None:
+        raise plug.PlugError(
+            "first line of multi issues file not #ISSUE# line"
+        )
+    blocks.append(IssueBlock(repo_name, block_start, offset - block_start))
+    return blocks
+
+
+def _index_path(issues_file: pathlib.Path) -> pathlib.Path:
+    path_digest = hashlib.sha256(
+        str(issues_file.resolve()).encode(CACHE_ENCODING)
+    ).hexdigest()
+    return cache_dir() / INDEX_DIRNAME / f"{path_digest}.json"
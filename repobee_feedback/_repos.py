@@ -0,0 +1,104 @@
+"""Resolution of student repo names to platform repos.
+
+.. module:: _repos
+    :synopsis: Resolves student repo names to repos on the platform, fetching
+        them ahead of time on a pool of worker threads where possible.
+"""
+import concurrent.futures
+from typing import Dict, Iterable, List, Mapping
+
+import repobee_plug as plug
+
+from repobee_feedback._scheduling import RequestScheduler
+
+
+class RepoResolver:
+    """Resolves repo names to repos. Repos that have been prefetched are
+    served from memory, all others are fetched one by one.
+
+    Repos are only kept for the duration of a run. They can't be persisted
+    between runs, as they wrap objects of the platform's client library that
+    issues are opened through, and caching only their URLs would save no
+    requests, as each repo must still be looked up by its URL.
+    """
+
+    def __init__(
+        self,
+        api: plug.PlatformAPI,
+        scheduler: RequestScheduler,
+        repo_name_to_team: Mapping[str, plug.StudentTeam],
+        assignment_names: Iterable[str],
+        workers: int = 1,
+    ):
+        self._api = api
+        self._scheduler = scheduler
+        self._repo_name_to_team = repo_name_to_team
+        self._assignment_names = list(assignment_names)
+        self._workers = workers
+        self._repos: Dict[str, plug.Repo] = {}
+
+    def prefetch(self, repo_names: Iterable[str]) -> None:
+        """Fetch the given repos up front, on a pool of worker threads. Each
+        repo is looked up in a separate scheduled call, such that every
+        lookup counts towards the rate limit, and a throttled lookup is
+        retried on its own. Repos that can't be looked up are fetched
+        individually on demand instead.
+        """
+        wanted_repo_names = set(repo_names) - self._repos.keys()
+        if not wanted_repo_names:
+            return
+
+        repo_urls = self._derive_repo_urls(wanted_repo_names)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._workers
+        ) as executor:
+            for repos in executor.map(self._lookup, repo_urls):
+                for repo in repos:
+                    if repo.name in wanted_repo_names:
+                        self._repos[repo.name] = repo
+
+    def get(self, repo_name: str) -> plug.Repo:
+        """Return the repo with the given name.
+
+        Raises:
+            :py:class:`repobee_plug.PlatformError`: If the repo has not been
+                prefetched and can't be fetched.
+        """
+        repo = self._repos.get(repo_name)
+        if repo is None:
+            repo = self._scheduler.call(
+                self._api.get_repo,
+                repo_name,
+                self._repo_name_to_team[repo_name].name,
+            )
+            self._repos[repo_name] = repo
+        return repo
+
+    def _lookup(self, repo_url: str) -> List[plug.Repo]:
+        try:
+            # an empty lookup would fetch all repos of the organization, so
+            # the URL is always passed
+            return self._scheduler.call(
+                lambda: list(self._api.get_repos([repo_url]))
+            )
+        except plug.PlatformError as exc:
+            plug.log.warning(f"Lookup of {repo_url} failed: {exc}")
+            return []
+
+    def _derive_repo_urls(self, repo_names: Iterable[str]) -> List[str]:
+        repo_names = set(repo_names)
+        if not repo_names:
+            return []
+        team_names = sorted(
+            {
+                self._repo_name_to_team[repo_name].name
+                for repo_name in repo_names
+            }
+        )
+        return [
+            url
+            for url in self._api.get_repo_urls(
+                self._assignment_names, team_names=team_names
+            )
+            if self._api.extract_repo_name(url) in repo_names
+        ]
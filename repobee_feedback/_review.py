@@ -0,0 +1,158 @@
+"""Interactive review of feedback issues before they are opened.
+
+.. module:: _review
+    :synopsis: Prompts for each issue whether to open it, with commands that
+        decide the remaining issues in bulk by repo name or title, and that
+        list the remaining issues page by page.
+"""
+import re
+from typing import Callable, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+import repobee_plug as plug
+
+PAGE_SIZE = 10
+# bodies are truncated harder in listings than when reviewing single issues
+SUMMARY_TRUNCATION_LENGTH = 60
+
+HELP = """\
+    y          open this issue
+    n          skip this issue
+    a          open this and all remaining issues
+    q          skip this and all remaining issues
+    r REGEX    open all remaining issues in repos whose names match REGEX
+    t [TITLE]  skip all remaining issues with the title TITLE, by default
+               the title of this issue
+    l          list the next page of remaining issues
+    ?          show this help"""
+
+# a rule matches a repo name and issue, and decides whether to open the issue
+_Rule = Tuple[Callable[[str, plug.Issue], bool], bool]
+_DECISION_STATUSES = {None: "", True: " (open)", False: " (skip)"}
+
+
+class IssueReview:
+    """Asks the user whether to open each issue. Besides deciding single
+    issues, the user can add rules that decide all remaining issues that
+    they match, such that issues are only prompted for until a rule matches
+    them. The first rule that matches an issue decides it.
+    """
+
+    def __init__(
+        self,
+        issues: Sequence[Tuple[str, plug.Issue]],
+        trunc_len: int,
+        format_body: Callable[[str, int], str],
+        page_size: int = PAGE_SIZE,
+    ):
+        self._issues = issues
+        self._trunc_len = trunc_len
+        self._format_body = format_body
+        self._page_size = page_size
+        self._rules: List[_Rule] = []
+        self._listed_up_to = 0
+
+    def decisions(self) -> Iterator[Tuple[str, plug.Issue, bool]]:
+        """Decide each issue in order, prompting for the issues that no rule
+        matches.
+
+        Returns:
+            The repo name, issue and whether to open it, for each issue.
+        """
+        for position, (repo_name, issue) in enumerate(self._issues):
+            yield repo_name, issue, self._decide(position, repo_name, issue)
+
+    def _decide(
+        self, position: int, repo_name: str, issue: plug.Issue
+    ) -> bool:
+        decision = self._apply_rules(repo_name, issue)
+        if decision is not None:
+            return decision
+
+        indented_body = self._format_body(issue.body, self._trunc_len)
+        plug.echo(
+            f'\nProcessing issue "{issue.title}" for {repo_name}:\n'
+            f"{indented_body}"
+        )
+        while True:
+            answer = input(
+                f'Open issue "{issue.title}" in repo {repo_name}? (y/n/?) '
+            ).strip()
+            command, _, argument = answer.partition(" ")
+            argument = argument.strip()
+            if command == "y":
+                return True
+            elif command in ("n", ""):
+                return False
+            elif command == "a":
+                self._rules.append((_matches_all, True))
+            elif command == "q":
+                self._rules.append((_matches_all, False))
+            elif command == "r" and argument:
+                try:
+                    pattern = re.compile(argument)
+                except re.error as exc:
+                    plug.echo(f"Invalid regex {argument!r}: {exc}")
+                    continue
+                self._rules.append((_matches_repo_name(pattern), True))
+            elif command == "t":
+                self._rules.append(
+                    (_matches_title(argument or issue.title), False)
+                )
+            elif command == "l":
+                self._list_remaining(position)
+                continue
+            else:
+                plug.echo(HELP)
+                continue
+
+            decision = self._apply_rules(repo_name, issue)
+            if decision is not None:
+                return decision
+
+    def _apply_rules(
+        self, repo_name: str, issue: plug.Issue
+    ) -> Optional[bool]:
+        return next(
+            (
+                decision
+                for matches, decision in self._rules
+                if matches(repo_name, issue)
+            ),
+            None,
+        )
+
+    def _list_remaining(self, position: int) -> None:
+        """List the next page of issues from the current position, starting
+        over from the current position when the end has been reached.
+        """
+        start = max(position, self._listed_up_to)
+        if start >= len(self._issues):
+            start = position
+        end = min(start + self._page_size, len(self._issues))
+        plug.echo(
+            f"Remaining issues {start - position + 1}-{end - position} of "
+            f"{len(self._issues) - position}:"
+        )
+        trunc_len = min(self._trunc_len, SUMMARY_TRUNCATION_LENGTH)
+        for repo_name, issue in self._issues[start:end]:
+            decision = self._apply_rules(repo_name, issue)
+            status = _DECISION_STATUSES[decision]
+            plug.echo(
+                f'{repo_name}: "{issue.title}"{status}\n'
+                f"{self._format_body(issue.body, trunc_len)}"
+            )
+        self._listed_up_to = end
+
+
+def _matches_all(repo_name: str, issue: plug.Issue) -> bool:
+    return True
+
+
+def _matches_repo_name(
+    pattern: Pattern[str],
+) -> Callable[[str, plug.Issue], bool]:
+    return lambda repo_name, _: bool(pattern.search(repo_name))
+
+
+def _matches_title(title: str) -> Callable[[str, plug.Issue], bool]:
+    return lambda _, issue: issue.title == title
@@ -0,0 +1,142 @@
+"""Rate limiting and retries for calls to the platform API.
+
+.. module:: _scheduling
+    :synopsis: A request scheduler that paces platform API calls with a token
+        bucket and backs off exponentially when the platform throttles.
+"""
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+import repobee_plug as plug
+
+T = TypeVar("T")
+
+BASE_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+class TokenBucket:
+    """A thread safe token bucket that hands out at most ``rate`` tokens per
+    second on average, with bursts of at most ``capacity`` tokens.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise plug.PlugError(f"rate limit must be positive, was {rate}")
+        self._rate = rate
+        self._capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token from the bucket, blocking until one is available."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._last_refill) * self._rate,
+            )
+            self._last_refill = now
+            # reserve the token right away, even if that puts the bucket in
+            # debt, so that waiting threads are served in arrival order
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            self._sleep(wait)
+
+
+class RequestScheduler:
+    """Schedules calls to the platform API. Calls are paced by an optional
+    token bucket, and calls that are throttled by the platform are retried
+    with exponential backoff and full jitter. While backing off, all other
+    calls made through the scheduler are held back as well.
+    """
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float, float], float] = random.uniform,
+    ):
+        if max_retries < 0:
+            raise plug.PlugError(
+                f"max retries must be non-negative, was {max_retries}"
+            )
+        self._bucket = (
+            TokenBucket(rate_limit, clock=clock, sleep=sleep)
+            if rate_limit is not None
+            else None
+        )
+        self._max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Call the function once the rate limit allows it, and retry it if
+        the platform responds that it's being throttled.
+
+        Args:
+            func: A function that calls the platform API.
+            args: Positional arguments to the function.
+            kwargs: Keyword arguments to the function.
+        Returns:
+            The return value of the function.
+        Raises:
+            :py:class:`repobee_plug.PlatformError`: If the function raises a
+                non-throttling error, or if it's still throttled after the
+                maximum amount of retries.
+        """
+        attempt = 0
+        while True:
+            self._wait_for_backoff()
+            if self._bucket is not None:
+                self._bucket.acquire()
+
+            try:
+                return func(*args, **kwargs)
+            except plug.PlatformError as exc:
+                if not _is_throttled(exc) or attempt >= self._max_retries:
+                    raise
+                delay = self._jitter(
+                    0, min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * 2 ** attempt)
+                )
+                plug.log.warning(
+                    f"Throttled by the platform, retrying in {delay:.1f}s: "
+                    f"{exc}"
+                )
+                with self._lock:
+                    self._resume_at = max(
+                        self._resume_at, self._clock() + delay
+                    )
+                attempt += 1
+
+    def _wait_for_backoff(self) -> None:
+        with self._lock:
+            wait = self._resume_at - self._clock()
+        if wait > 0:
+            self._sleep(wait)
+
+
+def _is_throttled(exc: plug.PlatformError) -> bool:
+    # GitHub responds to secondary rate limits with a 403, which is otherwise
+    # used for permission errors that are pointless to retry
+    return exc.status == 429 or (
+        exc.status == 403 and "rate limit" in str(exc).lower()
+    )
@@ -0,0 +1,50 @@
+"""Deterministic partitioning of a feedback run into shards.
+
+.. module:: _sharding
+    :synopsis: Partitions student repos into shards with a stable hash, such
+        that independent feedback runs can cover all repos without overlap.
+"""
+import dataclasses
+import hashlib
+from typing import Iterable, List
+
+
+@dataclasses.dataclass(frozen=True)
+class Shard:
+    """The shard with the given 1-based index, out of a number of shards."""
+
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse a shard on the form ``i/N``, where ``1 <= i <= N``.
+
+    Raises:
+        ValueError: If the value is not a valid shard.
+    """
+    index, sep, count = value.partition("/")
+    shard = Shard(int(index), int(count)) if sep else None
+    if shard is None or not 1 <= shard.index <= shard.count:
+        raise ValueError(f"expected a shard on the form i/N, got {value!r}")
+    return shard
+
+
+def shard_of(repo_name: str, num_shards: int) -> int:
+    """Return the 1-based index of the shard that the repo belongs to. The
+    hash is stable across processes and machines, unlike :py:func:`hash`.
+    """
+    digest = hashlib.sha256(repo_name.encode("utf8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards + 1
+
+
+def select_shard(repo_names: Iterable[str], shard: Shard) -> List[str]:
+    """Return the repo names that belong to the given shard, in order."""
+    return [
+        repo_name
+        for repo_name in repo_names
+        if shard_of(repo_name, shard.count) == shard.index
+    ]
@@ -0,0 +1,251 @@
+"""Timing and API call instrumentation for feedback runs.
+
+.. module:: _stats
+    :synopsis: Records the wall time of each phase of a feedback run, and the
+        call counts, latencies and errors of each platform API method.
+"""
+import bisect
+import collections
+import contextlib
+import dataclasses
+import json
+import pathlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+import repobee_plug as plug
+
+# upper bounds in seconds of the latency histogram buckets, the last bucket
+# is unbounded
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATS_ENCODING = "utf8"
+# API methods that may return lazy iterables which perform requests when
+# they are consumed
+ITERABLE_API_METHODS = frozenset(
+    ["get_repos", "get_repo_issues", "get_teams", "get_team_repos"]
+)
+# API methods that make requests to the platform, the others are local
+# helpers such as extract_repo_name
+REQUEST_API_METHODS = ITERABLE_API_METHODS | frozenset(
+    [
+        "assign_members",
+        "assign_repo",
+        "close_issue",
+        "create_issue",
+        "create_repo",
+        "create_team",
+        "delete_repo",
+        "delete_team",
+        "get_repo",
+        "verify_settings",
+    ]
+)
+
+
+@dataclasses.dataclass
+class MethodStats:
+    """Statistics for calls to a single platform API method."""
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    latency_histogram: List[int] = dataclasses.field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    def record(self, seconds: float, error: bool) -> None:
+        self.calls += 1
+        self.errors += int(error)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        self.latency_histogram[bucket] += 1
+
+
+class RunStats:
+    """Statistics for a single feedback run. Recording is thread safe."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.phases: Dict[str, float] = collections.defaultdict(float)
+        self.counts: Dict[str, int] = collections.Counter()
+        self.api_methods: Dict[str, MethodStats] = collections.defaultdict(
+            MethodStats
+        )
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the wall time spent in the context to the given phase."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            with self._lock:
+                self.phases[name] += elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counts[name] += amount
+
+    def instrument(self, api: plug.PlatformAPI) -> plug.PlatformAPI:
+        """Wrap the platform API such that every request is recorded."""
+        return _InstrumentedAPI(api, self)  # type: ignore
+
+    def call(
+        self, method_name: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """Call the function and record the call as a call to the given
+        platform API method.
+        """
+        start = self._clock()
+        error = True
+        try:
+            result = func(*args, **kwargs)
+            error = False
+            return result
+        finally:
+            self.record_call(method_name, self._clock() - start, error)
+
+    def record_call(self, method_name: str, seconds: float, error: bool):
+        with self._lock:
+            self.api_methods[method_name].record(seconds, error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(
+                phases=dict(self.phases),
+                counts=dict(self.counts),
+                api=dict(
+                    latency_buckets=list(LATENCY_BUCKETS),
+                    methods={
+                        name: dataclasses.asdict(method_stats)
+                        for name, method_stats in self.api_methods.items()
+                    },
+                ),
+            )
+
+    def write(self, path: pathlib.Path) -> None:
+        write_stats(self.to_dict(), path)
+
+    def summary(self) -> str:
+        """Return a human readable summary of the statistics."""
+        return format_summary(self.to_dict())
+
+
+def read_stats(path: pathlib.Path) -> Dict[str, Any]:
+    """Read statistics written by :py:func:`write_stats`."""
+    try:
+        return json.loads(path.read_text(encoding=STATS_ENCODING))
+    except ValueError as exc:
+        raise plug.PlugError(f"malformed stats file {path}: {exc}") from exc
+
+
+def write_stats(stats: Dict[str, Any], path: pathlib.Path) -> None:
+    """Write statistics as returned by :py:meth:`RunStats.to_dict` as
+    JSON.
+    """
+    path.write_text(json.dumps(stats, indent=2), encoding=STATS_ENCODING)
+
+
+def format_summary(stats: Dict[str, Any]) -> str:
+    """Format statistics as returned by :py:meth:`RunStats.to_dict` in a
+    human readable way.
+    """
+    lines = ["Phases:"]
+    lines.extend(
+        f"    {name:<24} {seconds:10.3f}s"
+        for name, seconds in stats["phases"].items()
+    )
+    if stats["counts"]:
+        lines.append("Counts:")
+        lines.extend(
+            f"    {name:<24} {count:10}"
+            for name, count in sorted(stats["counts"].items())
+        )
+
+    methods = stats["api"]["methods"]
+    if methods:
+        lines.append("API calls:")
+        for name, method_stats in sorted(methods.items()):
+            calls = method_stats["calls"]
+            mean = method_stats["total_seconds"] / calls if calls else 0
+            lines.append(
+                f"    {name:<24} {calls:10} calls "
+                f"{method_stats['errors']:6} errors "
+                f"mean {mean:.3f}s max {method_stats['max_seconds']:.3f}s"
+            )
+    return "\n".join(lines)
+
+
+def merge_stats(stats: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge statistics as returned by :py:meth:`RunStats.to_dict` from
+    several runs, e.g. the shards of a sharded run. Phase times, counts and
+    API calls are summed, such that phase times are the total time spent
+    across all runs.
+    """
+    phases: Dict[str, float] = collections.defaultdict(float)
+    counts: Dict[str, int] = collections.Counter()
+    methods: Dict[str, MethodStats] = collections.defaultdict(MethodStats)
+    for run_stats in stats:
+        if run_stats["api"]["latency_buckets"] != list(LATENCY_BUCKETS):
+            raise plug.PlugError(
+                "cannot merge statistics with different latency buckets"
+            )
+        for name, seconds in run_stats["phases"].items():
+            phases[name] += seconds
+        counts.update(run_stats["counts"])
+        for name, method_stats in run_stats["api"]["methods"].items():
+            merged = methods[name]
+            merged.calls += method_stats["calls"]
+            merged.errors += method_stats["errors"]
+            merged.total_seconds += method_stats["total_seconds"]
+            merged.max_seconds = max(
+                merged.max_seconds, method_stats["max_seconds"]
+            )
+            merged.latency_histogram = [
+                a + b
+                for a, b in zip(
+                    merged.latency_histogram,
+                    method_stats["latency_histogram"],
+                )
+            ]
+
+    return dict(
+        phases=dict(phases),
+        counts=dict(counts),
+        api=dict(
+            latency_buckets=list(LATENCY_BUCKETS),
+            methods={
+                name: dataclasses.asdict(method_stats)
+                for name, method_stats in methods.items()
+            },
+        ),
+    )
+
+
+class _InstrumentedAPI:
+    """Proxy for a platform API that records each call to a method that makes
+    requests. Iterables returned by the API are consumed inside of the call,
+    such that lazy fetching is included in the recorded latency.
+    """
+
+    def __init__(self, api: plug.PlatformAPI, stats: RunStats):
+        self._api = api
+        self._stats = stats
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._api, name)
+        if name not in REQUEST_API_METHODS:
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return list(result) if name in ITERABLE_API_METHODS else result
+
+        return lambda *args, **kwargs: self._stats.call(
+            name, call, *args, **kwargs
+        )
@@ -0,0 +1,72 @@
+"""Concurrent submission of feedback issues to the issue tracker.
+
+.. module:: _submission
+    :synopsis: Opens feedback issues through a bounded pool of worker threads
+        and reports the outcome for each repo in a deterministic order.
+"""
+import concurrent.futures
+import dataclasses
+from typing import Callable, List, Optional, Tuple
+
+import repobee_plug as plug
+
+
+@dataclasses.dataclass(frozen=True)
+class SubmissionResult:
+    """The outcome of opening a single feedback issue."""
+
+    repo_name: str
+    issue: plug.Issue
+    error: Optional[plug.PlatformError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class IssueSubmitter:
+    """Opens issues on a bounded pool of worker threads. Results are reported
+    in submission order, regardless of the order in which the workers finish.
+    """
+
+    def __init__(
+        self, open_issue: Callable[[str, plug.Issue], None], workers: int
+    ):
+        if workers < 1:
+            raise plug.PlugError(
+                f"number of workers must be positive, was {workers}"
+            )
+        self._open_issue = open_issue
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        )
+        self._pending: List[
+            Tuple[str, plug.Issue, concurrent.futures.Future]
+        ] = []
+
+    def __enter__(self) -> "IssueSubmitter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._executor.shutdown(wait=True)
+
+    def submit(self, repo_name: str, issue: plug.Issue) -> None:
+        """Schedule the issue to be opened in the given repo."""
+        future = self._executor.submit(self._open_issue, repo_name, issue)
+        self._pending.append((repo_name, issue, future))
+
+    def results(self) -> List[SubmissionResult]:
+        """Wait for all scheduled issues to be opened.
+
+        Returns:
+            One result per submitted issue, in submission order.
+        """
+        results = []
+        for repo_name, issue, future in self._pending:
+            try:
+                future.result()
+                results.append(SubmissionResult(repo_name, issue))
+            except plug.PlatformError as exc:
+                results.append(SubmissionResult(repo_name, issue, error=exc))
+        self._pending = []
+        return results
@@ -0,0 +1,109 @@
+"""Rendering of feedback issues from a template and a table of data.
+
+.. module:: _templates
+    :synopsis: Renders one feedback issue per row of a CSV or JSON lines data
+        table, by substituting the row's values into a template.
+"""
+import csv
+import json
+import pathlib
+import string
+import sys
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+import repobee_plug as plug
+
+REPO_NAME_COLUMN = "repo_name"
+# data tables exported from spreadsheets, such as Excel, often start with a
+# byte order mark, which would otherwise end up in the first column name
+DATA_ENCODING = "utf-8-sig"
+
+
+def render_issues(
+    template_file: pathlib.Path,
+    data_file: pathlib.Path,
+    repo_names: Iterable[str],
+) -> Iterator[Tuple[str, plug.Issue]]:
+    """Lazily render an issue for each row in the data table that belongs to
+    one of the given repos. The template is a :py:class:`string.Template`, in
+    which ``$column`` or ``${column}`` is substituted with the value of that
+    column in the row. As in an issue file, the first line of the rendered
+    template is the title, and the rest is the body.
+
+    Args:
+        template_file: Path to the template.
+        data_file: Path to a CSV file with a header row, or a JSON lines file
+            with one object per line. Each row must have a ``repo_name``.
+        repo_names: Names of the repos to render issues for.
+    Returns:
+        Pairs of repo name and issue, in the order of the data table.
+    """
+    template = string.Template(
+        template_file.read_text(encoding=sys.getdefaultencoding())
+    )
+    expected_repo_names = set(repo_names)
+    for line_number, row in _read_rows(data_file):
+        repo_name = row.get(REPO_NAME_COLUMN)
+        if repo_name is None:
+            raise plug.PlugError(
+                f"{data_file}:{line_number}: missing '{REPO_NAME_COLUMN}'"
+            )
+        if repo_name not in expected_repo_names:
+            continue
+
+        try:
+            text = template.substitute(row)
+        except KeyError as exc:
+            raise plug.PlugError(
+                f"{data_file}:{line_number}: no value for template "
+                f"variable {exc} in row for {repo_name}"
+            ) from exc
+
+        title, _, body = text.partition("\n")
+        yield repo_name, plug.Issue(title=title.strip(), body=body)
+
+
+def _read_rows(
+    data_file: pathlib.Path,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    suffix = data_file.suffix.lower()
+    with open(
+        str(data_file), mode="r", encoding=DATA_ENCODING, newline=""
+    ) as file:
+        if suffix == ".csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+        elif suffix in (".jsonl", ".ndjson"):
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError as exc:
+                    raise plug.PlugError(
+                        f"{data_file}:{line_number}: malformed JSON: {exc}"
+                    ) from exc
+                if not isinstance(obj, dict):
+                    raise plug.PlugError(
+                        f"{data_file}:{line_number}: expected a JSON object, "
+                        f"got {type(obj).__name__}"
+                    )
+                yield line_number, _to_row(obj)
+        else:
+            raise plug.PlugError(
+                f"unsupported data table format '{suffix}', expected .csv, "
+                ".jsonl or .ndjson"
+            )
+
+
+def _to_row(obj: Dict[str, Any]) -> Dict[str, str]:
+    # list values, e.g. failing tests, are put on separate lines
+    return {
+        key: (
+            "\n".join(map(str, value))
+            if isinstance(value, list)
+            else str(value)
+        )
+        for key, value in obj.items()
+    }
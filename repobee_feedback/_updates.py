@@ -0,0 +1,126 @@
+"""Updating previously opened feedback issues in place.
+
+.. module:: _updates
+    :synopsis: Finds the feedback issue previously opened in each repo with
+        the same title, preferring its number in the journal, and edits it
+        through the platform's own issue object.
+"""
+import concurrent.futures
+import dataclasses
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+import repobee_plug as plug
+
+from repobee_feedback._journal import Journal, normalize_body
+
+
+def issue_numbers_from_journal(journal: Journal) -> Dict[str, int]:
+    """Return the number of the last issue opened in each repo according to
+    the journal.
+    """
+    return {
+        entry.repo_name: entry.number
+        for entry in journal.read()
+        if entry.number is not None
+    }
+
+
+class IssueUpdater:
+    """The previously opened feedback issues of each repo. The issue to
+    update is the issue with the same title as the new issue, such that each
+    repo can have several feedback issues. If several issues have that
+    title, the issue with the known number is preferred, and otherwise the
+    most recent one.
+    """
+
+    def __init__(self, issue_numbers: Optional[Mapping[str, int]] = None):
+        self._issue_numbers = dict(issue_numbers or {})
+        self._repo_issues: Dict[str, List[plug.Issue]] = {}
+
+    def fetch(
+        self,
+        repo_names: Iterable[str],
+        get_repo_issues: Callable[[str], Iterable[plug.Issue]],
+        workers: int,
+    ) -> None:
+        """Fetch the issues of the given repos, with one bulk request per
+        repo.
+
+        Args:
+            repo_names: Names of the repos to fetch issues from.
+            get_repo_issues: A function that fetches the issues of a repo.
+            workers: Amount of repos to fetch issues from concurrently.
+        """
+        repo_names = list(repo_names)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            for repo_name, issues in zip(
+                repo_names, executor.map(get_repo_issues, repo_names)
+            ):
+                self._repo_issues[repo_name] = list(issues)
+
+    def find(self, repo_name: str, title: str) -> Optional[plug.Issue]:
+        """Return the issue to update in the repo, or None if there is no
+        such issue.
+        """
+        same_title = [
+            issue
+            for issue in self._repo_issues.get(repo_name, [])
+            if issue.title == title
+        ]
+        # the known number is that of the last issue opened in the repo,
+        # which may be a different feedback issue
+        number = self._issue_numbers.get(repo_name)
+        return next(
+            (issue for issue in same_title if issue.number == number),
+            max(same_title, key=lambda issue: issue.number or 0, default=None),
+        )
+
+    def is_unchanged(self, repo_name: str, issue: plug.Issue) -> bool:
+        """Check if the issue to update already has the title and body of the
+        given issue.
+        """
+        existing = self.find(repo_name, issue.title)
+        return (
+            existing is not None
+            and existing.title == issue.title
+            and normalize_body(existing.body) == normalize_body(issue.body)
+        )
+
+
+def edit_issue(issue: plug.Issue, title: str, body: str) -> plug.Issue:
+    """Edit the title and body of an issue fetched from the platform, through
+    the platform's own issue object. The platform API of RepoBee has no way
+    of editing issues, so only GitHub and GitLab issues are supported.
+
+    Returns:
+        The edited issue.
+    """
+    # accessing the implementation of an issue without one raises
+    impl: Any = getattr(issue, "implementation", None)
+    try:
+        if hasattr(impl, "edit"):
+            # PyGithub
+            impl.edit(title=title, body=body)
+        elif hasattr(impl, "save"):
+            # python-gitlab
+            impl.title = title
+            impl.description = body
+            impl.save()
+        else:
+            raise plug.PlatformError(
+                "editing issues is not supported on this platform"
+            )
+    except plug.PlatformError:
+        raise
+    except Exception as exc:
+        # the platform libraries' errors carry the HTTP status in different
+        # attributes
+        status = getattr(exc, "status", None) or getattr(
+            exc, "response_code", None
+        )
+        raise plug.PlatformError(
+            f"failed to edit issue #{issue.number}: {exc}", status=status
+        ) from exc
+    return dataclasses.replace(issue, title=title, body=body)
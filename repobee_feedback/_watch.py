@@ -0,0 +1,116 @@
+"""Watching of an issues directory for issue files as they are written.
+
+.. module:: _watch
+    :synopsis: Watches an issues directory with inotify, or by polling if
+        inotify is unavailable, and reports each expected issue file once it
+        has stopped changing.
+"""
+import contextlib
+import pathlib
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import repobee_plug as plug
+
+from repobee_feedback._manifest import FileStat
+
+try:
+    import inotify_simple  # type: ignore
+except ImportError:
+    inotify_simple = None
+
+# seconds between directory scans when polling
+POLL_INTERVAL = 1.0
+
+Wait = Callable[[Optional[float]], None]
+
+
+def watch_issue_files(
+    issues_dir: pathlib.Path,
+    repo_names: Iterable[str],
+    find_issue_files: Callable[[List[str]], Mapping[str, pathlib.Path]],
+    settle_time: float,
+    recursive: bool = False,
+    clock: Callable[[], float] = time.monotonic,
+    wait: Optional[Wait] = None,
+) -> Iterator[Tuple[str, pathlib.Path, FileStat]]:
+    """Watch the issues directory, and yield the issue file of each of the
+    given repos once its size and modification time have been unchanged for
+    the settle time. Each repo is yielded at most once, and watching stops
+    when all repos have been yielded.
+
+    Args:
+        issues_dir: The directory to watch.
+        repo_names: Names of the repos to watch for issue files of.
+        find_issue_files: A function that finds the issue files of the given
+            repos in the issues directory.
+        settle_time: Seconds that an issue file must be unchanged for.
+        recursive: Whether issue files may be in subdirectories, in which
+            case the directory is polled.
+        clock: A monotonic clock.
+        wait: A function that blocks for at most the given amount of seconds,
+            or until something changes. Defaults to waiting with inotify if
+            it's installed, and to polling otherwise.
+    Returns:
+        Triples of repo name, issue file and the stat of the file.
+    """
+    remaining = list(repo_names)
+    # repo name -> (file stat, when that stat was first seen)
+    pending: Dict[str, Tuple[FileStat, float]] = {}
+    with contextlib.ExitStack() as stack:
+        if wait is None:
+            wait = stack.enter_context(_waiter(issues_dir, recursive))
+
+        while remaining:
+            now = clock()
+            settled = set()
+            for repo_name, path in find_issue_files(remaining).items():
+                try:
+                    file_stat = FileStat.of(path)
+                except FileNotFoundError:
+                    continue
+
+                first_seen = pending.get(repo_name)
+                if first_seen is None or first_seen[0] != file_stat:
+                    pending[repo_name] = (file_stat, now)
+                elif now - first_seen[1] >= settle_time:
+                    del pending[repo_name]
+                    settled.add(repo_name)
+                    yield repo_name, path, file_stat
+
+            remaining = [name for name in remaining if name not in settled]
+            if remaining:
+                wait(settle_time if pending else None)
+
+
+@contextlib.contextmanager
+def _waiter(issues_dir: pathlib.Path, recursive: bool) -> Iterator[Wait]:
+    if inotify_simple is None or recursive:
+        plug.log.info(f"Polling {issues_dir} for issue files")
+        yield lambda timeout: time.sleep(
+            POLL_INTERVAL if timeout is None else timeout
+        )
+        return
+
+    flags = inotify_simple.flags
+    with inotify_simple.INotify() as inotify:
+        inotify.add_watch(
+            str(issues_dir),
+            flags.CREATE | flags.MODIFY | flags.CLOSE_WRITE | flags.MOVED_TO,
+        )
+
+        def wait(timeout: Optional[float]) -> None:
+            inotify.read(
+                timeout=None if timeout is None else int(timeout * 1000)
+            )
+
+        yield wait
@@ -7,26 +7,90 @@ student repos and opens them as issues on the issue tracker.
 
 .. moduleauthor:: Simon Larsén
 """
+import functools
+import io
+import os
 import pathlib
 import re
 import sys
 import argparse
 from textwrap import indent
-from typing import Iterable, Tuple, List, Mapping
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Collection,
+    Iterable,
+    Tuple,
+    List,
+    Mapping,
+    Optional,
+    Match,
+    Dict,
+    Set,
+)
 
 import repobee_plug as plug
+
+# importing the command classes registers the commands, their implementation
+# is only imported when they are run
 from repobee_feedback._generate_multi_issues_file import (  # noqa: F401
     GenerateMultiIssuesFile,
 )
+from repobee_feedback._merge_reports import (  # noqa: F401
+    MergeFeedbackReports,
+)
+
+if TYPE_CHECKING:
+    from repobee_feedback._existing_issues import ExistingIssues
+    from repobee_feedback._journal import Journal
+    from repobee_feedback._manifest import FileStat, Manifest
+    from repobee_feedback._multi_issues_index import IssueBlock
+    from repobee_feedback._repos import RepoResolver
+    from repobee_feedback._scheduling import RequestScheduler
+    from repobee_feedback._sharding import Shard
+    from repobee_feedback._stats import RunStats
+    from repobee_feedback._submission import SubmissionResult
+    from repobee_feedback._updates import IssueUpdater
 
 PLUGIN_NAME = "feedback"
 
 BEGIN_ISSUE_PATTERN = r"#ISSUE#(.*?)#(.*)"
+_BEGIN_ISSUE_REGEX = re.compile(BEGIN_ISSUE_PATTERN, re.IGNORECASE)
 INDENTATION_STR = "    "
 TRUNC_SIGN = "[...]"
+EXISTING_ISSUES_CACHE_FILENAME = "existing_issues.json"
 
 
 def callback(args: argparse.Namespace, api: plug.PlatformAPI) -> None:
+    from repobee_feedback._stats import RunStats
+
+    stats = RunStats()
+    try:
+        _run(args, stats.instrument(api), stats)
+    finally:
+        if args.stats:
+            plug.echo(stats.summary())
+        if args.stats_file:
+            stats.write(pathlib.Path(args.stats_file))
+
+
+def _run(
+    args: argparse.Namespace, api: plug.PlatformAPI, stats: "RunStats"
+) -> None:
+    from repobee_feedback._journal import Journal, issue_digest
+    from repobee_feedback._manifest import Manifest
+    from repobee_feedback._review import IssueReview
+    from repobee_feedback._scheduling import RequestScheduler
+    from repobee_feedback._sharding import select_shard
+    from repobee_feedback._submission import IssueSubmitter
+
+    if args.workers < 1:
+        # checked up front, as issues are read on the workers too
+        raise plug.PlugError(
+            f"number of workers must be positive, was {args.workers}"
+        )
+
     repo_name_to_team: Mapping[str, plug.StudentTeam] = {
         plug.generate_repo_name(
             student_team.name, assignment_name
@@ -34,27 +98,545 @@ def callback(args: argparse.Namespace, api: plug.PlatformAPI) -> None:
         for student_team in args.students
         for assignment_name in args.assignments
     }
+    if args.shard is not None:
+        shard_repo_names = select_shard(repo_name_to_team.keys(), args.shard)
+        plug.echo(
+            f"Shard {args.shard}: {len(shard_repo_names)} of "
+            f"{len(repo_name_to_team)} repos"
+        )
+        repo_name_to_team = {
+            repo_name: repo_name_to_team[repo_name]
+            for repo_name in shard_repo_names
+        }
     repo_names = list(repo_name_to_team.keys())
 
+    manifest = Manifest(args.manifest) if args.manifest else None
+    if args.only_changed and manifest is None:
+        raise plug.PlugError("--only-changed requires a --manifest")
+    journal = Journal(args.journal) if args.journal else None
+    if args.resume and journal is None:
+        raise plug.PlugError("--resume requires a --journal to resume")
+    if args.update and args.skip_existing:
+        raise plug.PlugError("--update can't be combined with --skip-existing")
+
+    if args.watch:
+        _watch_and_open_issues(
+            args, api, stats, repo_name_to_team, journal, manifest
+        )
+        return
+
+    with stats.phase("read issues"):
+        # stat issue files before reading them, such that a file that is
+        # modified after it has been read is considered changed next round
+        file_stats = (
+            _stat_issue_files(args, repo_names) if manifest is not None else {}
+        )
+        if manifest is not None and args.only_changed:
+            repo_names = _skip_unchanged_issue_files(
+                repo_names, file_stats, manifest
+            )
+        issues = _extract_expected_issues(
+            _read_issues(args, repo_names), repo_names, args.allow_missing
+        )
+        if manifest is not None and args.only_changed:
+            issues = _skip_issues(
+                issues,
+                manifest.is_unchanged,
+                "are unchanged since the last run",
+            )
+    stats.count("issues found", len(issues))
+
+    if journal is not None and args.resume:
+        with stats.phase("read journal"):
+            completed = journal.completed()
+            issues = _skip_issues(
+                issues,
+                lambda repo_name, issue: (repo_name, issue_digest(issue))
+                in completed,
+                "have already been opened according to the journal",
+            )
+
+    scheduler = RequestScheduler(
+        rate_limit=args.rate_limit, max_retries=args.max_retries
+    )
+    repos = _repo_resolver(api, scheduler, repo_name_to_team, args)
+
+    existing_issues = None
+    if args.skip_existing:
+        with stats.phase("fetch existing issues"):
+            existing_issues = _fetch_existing_issues(
+                [repo_name for repo_name, _ in issues],
+                repos,
+                api,
+                scheduler,
+                args,
+            )
+            issues = _skip_issues(
+                issues,
+                existing_issues.contains,
+                "already exist in their repos",
+            )
+
+    updater = None
+    updated_repo_names: Set[str] = set()
+    if args.update:
+        with stats.phase("fetch issues to update"):
+            updater = _fetch_issues_to_update(
+                [repo_name for repo_name, _ in issues],
+                repos,
+                api,
+                scheduler,
+                journal,
+                args.workers,
+            )
+            issues = _skip_issues(
+                issues, updater.is_unchanged, "are unchanged in their repos"
+            )
+        updated_repo_names = {
+            repo_name
+            for repo_name, issue in issues
+            if updater.find(repo_name, issue.title) is not None
+        }
+
+    # resolve all candidate repos up front, such that approved issues can be
+    # opened in the background while the remaining issues are reviewed
+    with stats.phase("resolve repos"):
+        repos.prefetch(repo_name for repo_name, _ in issues)
+
+    open_issue = _issue_opener(
+        repos,
+        api,
+        scheduler,
+        journal,
+        existing_issues,
+        manifest,
+        file_stats,
+        updater,
+        stats,
+    )
+    decisions = (
+        ((repo_name, issue, True) for repo_name, issue in issues)
+        if args.batch_mode
+        else IssueReview(
+            issues, args.truncation_length, _indent_issue_body
+        ).decisions()
+    )
+    try:
+        with IssueSubmitter(open_issue, args.workers) as submitter:
+            with stats.phase("review"):
+                for repo_name, issue, approved in decisions:
+                    if approved:
+                        submitter.submit(repo_name, issue)
+                    else:
+                        plug.echo("Skipping {}".format(repo_name))
+
+            with stats.phase("open issues"):
+                results = submitter.results()
+    finally:
+        if existing_issues is not None:
+            existing_issues.save()
+        if manifest is not None:
+            manifest.save()
+
+    _report_results(results, stats, journal, updated_repo_names)
+
+
+def _watch_and_open_issues(
+    args: argparse.Namespace,
+    api: plug.PlatformAPI,
+    stats: "RunStats",
+    repo_name_to_team: Mapping[str, plug.StudentTeam],
+    journal: Optional["Journal"],
+    manifest: Optional["Manifest"],
+) -> None:
+    """Watch the issues directory and open each expected issue as soon as
+    its issue file stops changing, until all issues have been opened or the
+    user interrupts.
+    """
+    from repobee_feedback._journal import issue_digest
+    from repobee_feedback._lazy_issues import lazy_issue_file
+    from repobee_feedback._scheduling import RequestScheduler
+    from repobee_feedback._submission import IssueSubmitter
+    from repobee_feedback._watch import watch_issue_files
+
+    if not args.batch_mode:
+        raise plug.PlugError("--watch requires --batch-mode")
+    if not _reads_issues_dir(args):
+        raise plug.PlugError("--watch requires an issues directory")
+    if args.skip_existing or args.update:
+        raise plug.PlugError(
+            "--watch can't be combined with --skip-existing or --update"
+        )
+
+    completed = (
+        journal.completed() if journal is not None and args.resume else set()
+    )
+    scheduler = RequestScheduler(
+        rate_limit=args.rate_limit, max_retries=args.max_retries
+    )
+    repos = _repo_resolver(api, scheduler, repo_name_to_team, args)
+    # filled in as issue files settle, before their issues are submitted
+    file_stats: Dict[str, "FileStat"] = {}
+    open_issue = _issue_opener(
+        repos, api, scheduler, journal, None, manifest, file_stats
+    )
+
+    read_issue = lazy_issue_file if args.lazy_bodies else _read_issue
+    issues_dir = pathlib.Path(args.issues_dir).resolve()
+    issue_files = watch_issue_files(
+        issues_dir,
+        repo_name_to_team.keys(),
+        lambda repo_names: _find_issue_files(
+            repo_names, issues_dir, args.recursive
+        ),
+        args.settle_time,
+        args.recursive,
+    )
+    plug.echo(
+        f"Watching {issues_dir} for {len(repo_name_to_team)} issue files, "
+        "press Ctrl+C to stop"
+    )
+    try:
+        with IssueSubmitter(open_issue, args.workers) as submitter:
+            with stats.phase("watch"):
+                try:
+                    for repo_name, path, file_stat in issue_files:
+                        issue = read_issue(path)
+                        stats.count("issues found")
+                        if (repo_name, issue_digest(issue)) in completed or (
+                            manifest is not None
+                            and args.only_changed
+                            and manifest.is_unchanged(repo_name, issue)
+                        ):
+                            plug.echo(f"Skipping unchanged {repo_name}")
+                            continue
+                        file_stats[repo_name] = file_stat
+                        submitter.submit(repo_name, issue)
+                        plug.echo(f"Submitted issue for {repo_name}")
+                except KeyboardInterrupt:
+                    plug.echo("Stopped watching")
+
+            with stats.phase("open issues"):
+                results = submitter.results()
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+    _report_results(results, stats, journal)
+
+
+def _read_issues(
+    args: argparse.Namespace, repo_names: List[str]
+) -> Iterable[Tuple[str, plug.Issue]]:
+    """Read issues from the issue source selected on the command line."""
     if "multi_issues_file" in args and args.multi_issues_file is not None:
         issues_file = pathlib.Path(args.multi_issues_file).resolve()
-        all_issues = _parse_multi_issues_file(issues_file)
+        return (
+            _read_indexed_issues(issues_file, repo_names, args.lazy_bodies)
+            if args.index_multi_issues_file or args.lazy_bodies
+            else _parse_multi_issues_file(issues_file, args.parse_processes)
+        )
+    elif args.lazy_bodies and not _reads_issues_dir(args):
+        raise plug.PlugError(
+            "--lazy-bodies requires an issues directory or a multi-issues "
+            "file"
+        )
+    elif "issues_archive" in args and args.issues_archive is not None:
+        from repobee_feedback._archives import read_archive_issues
+
+        return read_archive_issues(
+            pathlib.Path(args.issues_archive), repo_names
+        )
+    elif "issues_jsonl" in args and args.issues_jsonl is not None:
+        from repobee_feedback._jsonl_issues import read_jsonl_issues
+
+        return read_jsonl_issues(pathlib.Path(args.issues_jsonl))
+    elif "issues_template" in args and args.issues_template is not None:
+        if args.template_data is None:
+            raise plug.PlugError("--issues-template requires --template-data")
+        from repobee_feedback._templates import render_issues
+
+        return render_issues(
+            pathlib.Path(args.issues_template),
+            pathlib.Path(args.template_data),
+            repo_names,
+        )
     else:
         issues_dir = pathlib.Path(args.issues_dir).resolve()
-        all_issues = _collect_issues(repo_names, issues_dir)
+        return _collect_issues(
+            repo_names,
+            issues_dir,
+            args.recursive,
+            args.workers,
+            args.lazy_bodies,
+        )
 
-    issues = _extract_expected_issues(
-        all_issues, repo_names, args.allow_missing
+
+def _stat_issue_files(
+    args: argparse.Namespace, repo_names: List[str]
+) -> Dict[str, "FileStat"]:
+    """Stat the issue files of the given repos, if issues are read from an
+    issues directory.
+    """
+    from repobee_feedback._manifest import FileStat
+
+    if not _reads_issues_dir(args):
+        return {}
+    issue_files = _find_issue_files(
+        repo_names, pathlib.Path(args.issues_dir).resolve(), args.recursive
+    )
+    return {
+        repo_name: FileStat.of(path) for repo_name, path in issue_files.items()
+    }
+
+
+def _reads_issues_dir(args: argparse.Namespace) -> bool:
+    """Check if issues are read from an issues directory, which is the
+    default issue source.
+    """
+    return all(
+        getattr(args, source, None) is None
+        for source in (
+            "multi_issues_file",
+            "issues_archive",
+            "issues_jsonl",
+            "issues_template",
+        )
     )
-    for repo_name, issue in issues:
-        open_issue = args.batch_mode or _ask_for_open(
-            issue, repo_name, args.truncation_length
+
+
+def _skip_unchanged_issue_files(
+    repo_names: List[str],
+    file_stats: Mapping[str, "FileStat"],
+    manifest: "Manifest",
+) -> List[str]:
+    """Skip the repos whose issue files have the same size and modification
+    time as when their last issue was opened, without reading the files.
+    """
+    remaining = [
+        repo_name
+        for repo_name in repo_names
+        if repo_name not in file_stats
+        or not manifest.is_unchanged_file(repo_name, file_stats[repo_name])
+    ]
+    num_skipped = len(repo_names) - len(remaining)
+    if num_skipped:
+        plug.echo(
+            f"Skipping {num_skipped} issue files that are unchanged since "
+            "the last run"
         )
-        if open_issue:
-            repo = api.get_repo(repo_name, repo_name_to_team[repo_name].name)
-            api.create_issue(issue.title, issue.body, repo)
+    return remaining
+
+
+def _skip_issues(
+    repos_and_issues: List[Tuple[str, plug.Issue]],
+    should_skip: Callable[[str, plug.Issue], bool],
+    reason: str,
+) -> List[Tuple[str, plug.Issue]]:
+    """Skip the issues for which the predicate holds, and tell the user how
+    many issues were skipped for the given reason.
+    """
+    remaining = [
+        (repo_name, issue)
+        for repo_name, issue in repos_and_issues
+        if not should_skip(repo_name, issue)
+    ]
+    num_skipped = len(repos_and_issues) - len(remaining)
+    if num_skipped:
+        plug.echo(f"Skipping {num_skipped} issues that {reason}")
+    return remaining
+
+
+def _repo_resolver(
+    api: plug.PlatformAPI,
+    scheduler: "RequestScheduler",
+    repo_name_to_team: Mapping[str, plug.StudentTeam],
+    args: argparse.Namespace,
+) -> "RepoResolver":
+    from repobee_feedback._repos import RepoResolver
+
+    return RepoResolver(
+        api, scheduler, repo_name_to_team, args.assignments, args.workers
+    )
+
+
+def _platform_cache_key(args: argparse.Namespace) -> Callable[[str], str]:
+    """Return a function that maps a repo name to a cache key that is unique
+    across platforms and organizations.
+    """
+    platform_prefix = "{}/{}".format(
+        getattr(args, "base_url", None), getattr(args, "org_name", None)
+    )
+    return lambda repo_name: f"{platform_prefix}/{repo_name}"
+
+
+def _fetch_existing_issues(
+    repo_names: List[str],
+    repos: "RepoResolver",
+    api: plug.PlatformAPI,
+    scheduler: "RequestScheduler",
+    args: argparse.Namespace,
+) -> "ExistingIssues":
+    from repobee_feedback._cache import JsonCache, cache_dir
+    from repobee_feedback._existing_issues import ExistingIssues
+
+    cache = (
+        JsonCache(cache_dir() / EXISTING_ISSUES_CACHE_FILENAME, args.cache_ttl)
+        if args.cache_ttl > 0
+        else None
+    )
+    existing_issues = ExistingIssues(cache, _platform_cache_key(args))
+
+    repos.prefetch(repo_names)
+    existing_issues.fetch(
+        repo_names, _repo_issues_getter(repos, api, scheduler), args.workers
+    )
+    return existing_issues
+
+
+def _fetch_issues_to_update(
+    repo_names: List[str],
+    repos: "RepoResolver",
+    api: plug.PlatformAPI,
+    scheduler: "RequestScheduler",
+    journal: Optional["Journal"],
+    workers: int,
+) -> "IssueUpdater":
+    """Fetch the issues of the given repos, to find the issues to update.
+    Issues are identified by their titles, and by their numbers in the
+    journal, if there is one.
+    """
+    from repobee_feedback._updates import (
+        IssueUpdater,
+        issue_numbers_from_journal,
+    )
+
+    updater = IssueUpdater(
+        issue_numbers_from_journal(journal) if journal is not None else None
+    )
+    repos.prefetch(repo_names)
+    updater.fetch(
+        repo_names, _repo_issues_getter(repos, api, scheduler), workers
+    )
+    return updater
+
+
+def _repo_issues_getter(
+    repos: "RepoResolver",
+    api: plug.PlatformAPI,
+    scheduler: "RequestScheduler",
+) -> Callable[[str], List[plug.Issue]]:
+    def get_repo_issues(repo_name: str) -> List[plug.Issue]:
+        repo = repos.get(repo_name)
+        return scheduler.call(lambda: list(api.get_repo_issues(repo)))
+
+    return get_repo_issues
+
+
+def _issue_opener(
+    repos: "RepoResolver",
+    api: plug.PlatformAPI,
+    scheduler: "RequestScheduler",
+    journal: Optional["Journal"] = None,
+    existing_issues: Optional["ExistingIssues"] = None,
+    manifest: Optional["Manifest"] = None,
+    file_stats: Optional[Mapping[str, "FileStat"]] = None,
+    updater: Optional["IssueUpdater"] = None,
+    stats: Optional["RunStats"] = None,
+) -> Callable[[str, plug.Issue], None]:
+    """Return a function that opens an issue in a repo, and records it in
+    the journal, existing issues index and manifest, if provided. If an
+    updater is provided, the issue to update in the repo is edited instead,
+    if there is one. Edits bypass the platform API, and are recorded in the
+    statistics, if provided, as calls to "edit_issue".
+    """
+    from repobee_feedback._jsonl_issues import FeedbackIssue
+    from repobee_feedback._lazy_issues import LazyIssue
+    from repobee_feedback._updates import edit_issue
+
+    file_stats = file_stats or {}
+    edit = (
+        functools.partial(stats.call, "edit_issue", edit_issue)
+        if stats is not None
+        else edit_issue
+    )
+
+    def open_issue(repo_name: str, issue: plug.Issue) -> None:
+        if isinstance(issue, LazyIssue):
+            # load the body once, it's released when the issue is opened
+            issue = issue.load()
+        repo = repos.get(repo_name)
+        metadata = (
+            dict(assignees=issue.assignees)
+            if isinstance(issue, FeedbackIssue) and issue.assignees
+            else {}
+        )
+        existing = (
+            updater.find(repo_name, issue.title)
+            if updater is not None
+            else None
+        )
+        created = (
+            scheduler.call(edit, existing, issue.title, issue.body)
+            if existing is not None
+            else scheduler.call(
+                api.create_issue, issue.title, issue.body, repo, **metadata
+            )
+        )
+        if journal is not None:
+            journal.append(repo_name, issue, created.number)
+        if existing_issues is not None:
+            existing_issues.add(repo_name, issue)
+        if manifest is not None:
+            manifest.record(repo_name, issue, file_stats.get(repo_name))
+
+    return open_issue
+
+
+def _report_results(
+    results: List["SubmissionResult"],
+    stats: "RunStats",
+    journal: Optional["Journal"] = None,
+    updated_repo_names: Collection[str] = (),
+) -> None:
+    num_opened = sum(result.ok for result in results)
+    stats.count("issues opened", num_opened)
+    stats.count("issues failed", len(results) - num_opened)
+
+    failed_repos = []
+    for result in results:
+        if result.ok:
+            action = (
+                "Updated"
+                if result.repo_name in updated_repo_names
+                else "Opened"
+            )
+            plug.echo(
+                f'{action} issue "{result.issue.title}" in {result.repo_name}'
+            )
         else:
-            plug.echo("Skipping {}".format(repo_name))
+            plug.log.error(
+                f"Failed to open issue in {result.repo_name}: {result.error}"
+            )
+            failed_repos.append(result.repo_name)
+
+    if failed_repos:
+        retry_hint = (
+            ". Rerun with --resume to retry only the failed issues"
+            if journal is not None
+            else ""
+        )
+        raise plug.PlugError(
+            "Failed to open issues for: "
+            + ", ".join(failed_repos)
+            + retry_hint
+        )
+
+
+def _parse_shard(value: str) -> "Shard":
+    from repobee_feedback._sharding import parse_shard
+
+    return parse_shard(value)
 
 
 class Feedback(plug.Plugin, plug.cli.Command):
@@ -85,6 +667,56 @@ class Feedback(plug.Plugin, plug.cli.Command):
         converter=int,
         default=sys.maxsize,
     )
+    workers = plug.cli.option(
+        help=(
+            "number of issues to open concurrently, each one on a separate "
+            "worker thread"
+        ),
+        converter=int,
+        default=1,
+    )
+    rate_limit = plug.cli.option(
+        help=(
+            "maximum average number of API requests per second, by default "
+            "there is no limit"
+        ),
+        converter=float,
+    )
+    max_retries = plug.cli.option(
+        help=(
+            "how many times to retry a request that is throttled by the "
+            "platform, with exponential backoff between attempts"
+        ),
+        converter=int,
+        default=5,
+    )
+    journal = plug.cli.option(
+        help=(
+            "file to append each opened issue to, such that an interrupted "
+            "run can be resumed with --resume"
+        ),
+        converter=pathlib.Path,
+    )
+    resume = plug.cli.flag(
+        help=(
+            "skip issues that have already been opened according to the "
+            "journal"
+        )
+    )
+    skip_existing = plug.cli.flag(
+        help=(
+            "skip issues that already exist in their repos, as determined by "
+            "fetching the existing issues of each repo"
+        )
+    )
+    cache_ttl = plug.cli.option(
+        help=(
+            "how many seconds data fetched from the platform is cached "
+            "between runs, 0 disables caching"
+        ),
+        converter=float,
+        default=600,
+    )
 
     group_mutex = plug.cli.mutually_exclusive_group(
         issues_dir=plug.cli.option(
@@ -107,8 +739,121 @@ class Feedback(plug.Plugin, plug.cli.Command):
             ),
             converter=pathlib.Path,
         ),
+        issues_archive=plug.cli.option(
+            help=(
+                "tar (optionally compressed) or zip archive containing issue "
+                "files named <STUDENT_REPO_NAME>.md in any directory, which "
+                "are read without extracting the archive"
+            ),
+            converter=pathlib.Path,
+        ),
+        issues_jsonl=plug.cli.option(
+            help=(
+                "JSON lines file with one issue per line, as an object with "
+                "the keys repo_name, title, body and optionally assignees"
+            ),
+            converter=pathlib.Path,
+        ),
+        issues_template=plug.cli.option(
+            help=(
+                "template to render issues from, with one issue per row in "
+                "the --template-data table; $COLUMN is replaced by the value "
+                "of COLUMN in the row, and the first line is the title"
+            ),
+            converter=pathlib.Path,
+        ),
         __required__=True,
     )
+    template_data = plug.cli.option(
+        help=(
+            "CSV (with a header) or JSON lines table with the data to render "
+            "--issues-template with, which must have a repo_name column"
+        ),
+        converter=pathlib.Path,
+    )
+    stats = plug.cli.flag(
+        help=(
+            "print the time spent in each phase of the run, and statistics "
+            "for each kind of API call"
+        )
+    )
+    stats_file = plug.cli.option(
+        help="write the statistics of the run as JSON to this file",
+        converter=pathlib.Path,
+    )
+    recursive = plug.cli.flag(
+        help=(
+            "also search subdirectories of the issues directory for issue "
+            "files, e.g. <ASSIGNMENT>/<STUDENT_REPO_NAME>.md"
+        )
+    )
+    manifest = plug.cli.option(
+        help=(
+            "file that maps each repo to a hash of the last issue opened in "
+            "it, which is updated as issues are opened"
+        ),
+        converter=pathlib.Path,
+    )
+    only_changed = plug.cli.flag(
+        help=(
+            "only open issues that are new or have changed since they were "
+            "last opened according to the manifest; issue files with the "
+            "same size and modification time are skipped without reading them"
+        )
+    )
+    watch = plug.cli.flag(
+        help=(
+            "watch the issues directory and open each expected issue as soon "
+            "as its issue file has been written, until all issues have been "
+            "opened; requires --batch-mode"
+        )
+    )
+    settle_time = plug.cli.option(
+        help=(
+            "with --watch, how many seconds an issue file must be unchanged "
+            "before its issue is opened"
+        ),
+        converter=float,
+        default=2.0,
+    )
+    shard = plug.cli.option(
+        help=(
+            "only open issues in shard i out of N, given as i/N, where the "
+            "student repos are partitioned into N shards with a stable hash; "
+            "N runs with shards 1/N to N/N cover all repos without overlap"
+        ),
+        converter=_parse_shard,
+    )
+    update = plug.cli.flag(
+        help=(
+            "edit the feedback issue with the same title previously opened "
+            "in each repo instead of opening a new one, and skip repos where "
+            "it's unchanged; of several issues with the same title, the one "
+            "in the journal is edited"
+        )
+    )
+    lazy_bodies = plug.cli.flag(
+        help=(
+            "only keep the titles of the issues in memory, and read each "
+            "body from the issues directory or multi-issues file when it's "
+            "needed; bounds memory use for runs with large issue bodies"
+        )
+    )
+    index_multi_issues_file = plug.cli.flag(
+        help=(
+            "cache a byte offset index of the multi-issues file, and only "
+            "read the issues of the expected repos from it"
+        )
+    )
+    parse_processes = plug.cli.option(
+        help=(
+            "number of processes to parse the multi-issues file with, each "
+            "one parsing a separate chunk of the file; speeds up parsing of "
+            "very large files"
+        ),
+        converter=int,
+        default=1,
+    )
 
     def command(self, api: plug.PlatformAPI):
         callback(self.args, api)
@@ -120,17 +865,6 @@ def _indent_issue_body(body: str, trunc_len: int):
     return indented_body + body_end
 
 
-def _ask_for_open(issue: plug.Issue, repo_name: str, trunc_len: int) -> bool:
-    indented_body = _indent_issue_body(issue.body, trunc_len)
-    issue_description = (
-        f'\nProcessing issue "{issue.title}" for {repo_name}:\n{indented_body}'
-    )
-    plug.echo(issue_description)
-    return (
-        input(f'Open issue "{issue.title}" in repo {repo_name}? (y/n) ') == "y"
-    )
-
-
 def _extract_expected_issues(
     repos_and_issues, repo_names, allow_missing
 ) -> List[Tuple[str, plug.Issue]]:
@@ -154,15 +888,70 @@ def _extract_expected_issues(
 
 
 def _collect_issues(
-    repo_names: Iterable[str], issues_dir: pathlib.Path
+    repo_names: Iterable[str],
+    issues_dir: pathlib.Path,
+    recursive: bool = False,
+    workers: int = 1,
+    lazy: bool = False,
 ) -> Iterable[Tuple[str, plug.Issue]]:
-    issues = []
-    for repo_name in repo_names:
-        expected_file = issues_dir / "{}.md".format(repo_name)
-        if expected_file.is_file():
-            issues.append((repo_name, _read_issue(expected_file)))
+    """Read the issue files of the given repos. If lazy, only the titles are
+    read up front, and each body is read from its file each time it's
+    accessed.
+    """
+    import concurrent.futures
+
+    from repobee_feedback._lazy_issues import lazy_issue_file
+
+    issue_files = _find_issue_files(repo_names, issues_dir, recursive)
+    read_issue = lazy_issue_file if lazy else _read_issue
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        issues = executor.map(read_issue, issue_files.values())
+        return list(zip(issue_files.keys(), issues))
+
 
-    return issues
+def _find_issue_files(
+    repo_names: Iterable[str], issues_dir: pathlib.Path, recursive: bool
+) -> Dict[str, pathlib.Path]:
+    """Find the issue files of the given repos by listing the issues
+    directory, and optionally its subdirectories, instead of checking for
+    each file separately.
+
+    Returns:
+        A mapping from repo name to issue file, in the order of the repo
+        names.
+    """
+    repo_names = list(repo_names)
+    expected_repo_names = set(repo_names)
+    found: Dict[str, pathlib.Path] = {}
+    dirs = [issues_dir] if issues_dir.is_dir() else []
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    dirs.append(pathlib.Path(entry.path))
+                    continue
+
+                repo_name, ext = os.path.splitext(entry.name)
+                if (
+                    ext != ".md"
+                    or repo_name not in expected_repo_names
+                    or not entry.is_file()
+                ):
+                    continue
+                if repo_name in found:
+                    raise plug.PlugError(
+                        f"Found multiple issue files for {repo_name}: "
+                        f"{found[repo_name]} and {entry.path}"
+                    )
+                found[repo_name] = pathlib.Path(entry.path)
+
+    return {
+        repo_name: found[repo_name]
+        for repo_name in repo_names
+        if repo_name in found
+    }
 
 
 def _read_issue(issue_path: pathlib.Path) -> plug.Issue:
@@ -171,38 +960,141 @@ def _read_issue(issue_path: pathlib.Path) -> plug.Issue:
 
 
 def _parse_multi_issues_file(
+    issues_file: pathlib.Path, processes: int = 1
+) -> Iterable[Tuple[str, plug.Issue]]:
+    """Lazily parse the multi-issues file in a single pass, yielding each
+    issue as soon as its block ends. With more than one process, the file is
+    instead split into chunks at #ISSUE# lines, which are parsed in parallel
+    and yielded in file order, giving the same issues as a single pass.
+    """
+    if processes > 1:
+        from repobee_feedback._chunked_parsing import parse_in_chunks
+
+        return parse_in_chunks(
+            issues_file,
+            processes,
+            _match_begin_issue,
+            _parse_multi_issues_chunk,
+        )
+    return _parse_multi_issues_lines(issues_file)
+
+
+def _parse_multi_issues_lines(
     issues_file: pathlib.Path,
 ) -> Iterable[Tuple[str, plug.Issue]]:
     with open(
         str(issues_file), mode="r", encoding=sys.getdefaultencoding()
     ) as file:
-        lines = list(file.readlines())
+        yield from _parse_issue_blocks(file)
+
+
+def _parse_multi_issues_chunk(
+    issues_file: pathlib.Path, start: int, end: int
+) -> List[Tuple[str, str, str]]:
+    """Parse the repo name, title and body of each issue in a byte range of
+    the multi-issues file that starts with an #ISSUE# line. Runs in a
+    separate process.
+    """
+    with open(str(issues_file), mode="rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode(sys.getdefaultencoding())
+    # translate newlines the same way as reading in text mode does
+    return [
+        (repo_name, issue.title, issue.body)
+        for repo_name, issue in _parse_issue_blocks(
+            io.StringIO(text, newline=None)
+        )
+    ]
 
-    if not lines or not re.match(BEGIN_ISSUE_PATTERN, lines[0], re.IGNORECASE):
+
+def _parse_issue_blocks(
+    lines: Iterable[str],
+) -> Iterable[Tuple[str, plug.Issue]]:
+    lines = iter(lines)
+    match = _match_begin_issue(next(lines, ""))
+    if not match:
         raise plug.PlugError(
             "first line of multi issues file not #ISSUE# line"
         )
 
-    issue_blocks = _extract_issue_blocks(lines)
-    return list(_extract_issues(issue_blocks, lines))
+    repo_name, title = match.groups()
+    body_lines: List[str] = []
+    for line in lines:
+        match = _match_begin_issue(line)
+        if match:
+            yield _create_issue(repo_name, title, body_lines)
+            repo_name, title = match.groups()
+            body_lines = []
+        else:
+            body_lines.append(line)
+
+    yield _create_issue(repo_name, title, body_lines)
+
+
+def _read_indexed_issues(
+    issues_file: pathlib.Path, repo_names: Iterable[str], lazy: bool = False
+) -> Iterable[Tuple[str, plug.Issue]]:
+    """Read only the issues for the given repos from the multi-issues file,
+    using its byte offset index to seek directly to each issue block. If
+    lazy, only the #ISSUE# line of each block is read up front, and the body
+    is read from the block each time it's accessed.
+    """
+    from repobee_feedback._lazy_issues import lazy_issue
+    from repobee_feedback._multi_issues_index import load_index
+
+    expected_repo_names = set(repo_names)
+    with open(str(issues_file), mode="rb") as file:
+        for block in load_index(issues_file, _match_begin_issue):
+            if block.repo_name not in expected_repo_names:
+                continue
+
+            if lazy:
+                file.seek(block.offset)
+                header = file.readline(block.length)
+                match = _match_begin_issue(
+                    header.decode(sys.getdefaultencoding())
+                )
+                assert match
+                repo_name, title = match.groups()
+                yield repo_name, lazy_issue(
+                    title.strip(),
+                    functools.partial(
+                        _read_issue_block_body, issues_file, block
+                    ),
+                )
+            else:
+                yield _read_issue_block(file, block)
+
+
+def _read_issue_block(
+    file: BinaryIO, block: "IssueBlock"
+) -> Tuple[str, plug.Issue]:
+    file.seek(block.offset)
+    text = file.read(block.length).decode(sys.getdefaultencoding())
+    # translate newlines the same way as reading in text mode does
+    first_line, *body_lines = io.StringIO(text, newline=None).readlines()
+    match = _match_begin_issue(first_line)
+    assert match
+    repo_name, title = match.groups()
+    return _create_issue(repo_name, title, body_lines)
+
 
+def _read_issue_block_body(
+    issues_file: pathlib.Path, block: "IssueBlock"
+) -> str:
+    with open(str(issues_file), mode="rb") as file:
+        _, issue = _read_issue_block(file, block)
+        return issue.body
 
-def _extract_issue_blocks(lines: List[str]):
-    issue_blocks = []
-    prev = 0
-    for i, line in enumerate(lines[1:], 1):
-        if re.match(BEGIN_ISSUE_PATTERN, line, re.IGNORECASE):
-            issue_blocks.append((prev, i))
-            prev = i
-    issue_blocks.append((prev, len(lines)))
-    return issue_blocks
 
+def _match_begin_issue(line: str) -> Optional[Match[str]]:
+    # the prefix check is much cheaper than the regex, and rules out almost
+    # all body lines
+    return line.startswith("#") and _BEGIN_ISSUE_REGEX.match(line) or None
 
-def _extract_issues(issue_blocks: Iterable[Tuple[int, int]], lines: List[str]):
-    for begin, end in issue_blocks:
-        match = re.match(BEGIN_ISSUE_PATTERN, lines[begin], re.IGNORECASE)
-        assert match
 
-        repo_name, title = match.groups()
-        body = "".join(lines[begin + 1 : end])
-        yield (repo_name, plug.Issue(title=title.strip(), body=body.rstrip()))
+def _create_issue(
+    repo_name: str, title: str, body_lines: List[str]
+) -> Tuple[str, plug.Issue]:
+    body = "".join(body_lines)
+    return (repo_name, plug.Issue(title=title.strip(), body=body.rstrip()))
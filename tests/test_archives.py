@@ -0,0 +1,76 @@
+import io
+import sys
+import tarfile
+import zipfile
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _archives
+
+ISSUE_FILES = {
+    "feedback/task-1/slarse-task-1.md": "Pass\nWell done!\r\nFlawless.",
+    "feedback/task-1/glassey-task-1.md": "Fail\nSevere errors.",
+    "feedback/notes.md": "Not an issue\n",
+}
+EXPECTED_ISSUES = [
+    ("slarse-task-1", plug.Issue(title="Pass", body="Well done!\nFlawless.")),
+    ("glassey-task-1", plug.Issue(title="Fail", body="Severe errors.")),
+]
+
+
+def _write_tar(path, files):
+    with tarfile.open(str(path), mode="w:gz") as tar_file:
+        for name, content in files.items():
+            data = content.encode(sys.getdefaultencoding())
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar_file.addfile(info, io.BytesIO(data))
+
+
+def _write_zip(path, files):
+    with zipfile.ZipFile(str(path), mode="w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+
+
+class TestReadArchiveIssues:
+    """Tests for reading issue files from archives."""
+
+    @pytest.mark.parametrize(
+        "filename, write_archive",
+        [("feedback.tar.gz", _write_tar), ("feedback.zip", _write_zip)],
+    )
+    def test_reads_expected_issues(self, tmp_path, filename, write_archive):
+        archive = tmp_path / filename
+        write_archive(archive, ISSUE_FILES)
+
+        issues = list(
+            _archives.read_archive_issues(
+                archive, ["slarse-task-1", "glassey-task-1", "grundb-task-1"]
+            )
+        )
+
+        assert issues == EXPECTED_ISSUES
+
+    def test_raises_on_duplicate_issue_files(self, tmp_path):
+        archive = tmp_path / "feedback.zip"
+        _write_zip(
+            archive,
+            {
+                "round-1/slarse-task-1.md": "Pass\n",
+                "round-2/slarse-task-1.md": "Fail\n",
+            },
+        )
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            list(_archives.read_archive_issues(archive, ["slarse-task-1"]))
+
+        assert "multiple issue files" in str(exc_info.value)
+
+    def test_raises_on_non_archive(self, tmp_path):
+        not_archive = tmp_path / "feedback.md"
+        not_archive.write_text("Pass\nWell done!")
+
+        with pytest.raises(plug.PlugError):
+            list(_archives.read_archive_issues(not_archive, ["slarse-task-1"]))
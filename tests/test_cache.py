@@ -0,0 +1,89 @@
+from repobee_feedback import _cache
+
+
+class TestJsonCache:
+    """Tests for the on-disk cache with expiring entries."""
+
+    def test_entries_persist_between_instances(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = _cache.JsonCache(path, ttl=60)
+        cache.put("key", ["value"])
+        cache.save()
+
+        assert _cache.JsonCache(path, ttl=60).get("key") == ["value"]
+
+    def test_expired_entries_are_absent(self, tmp_path):
+        now = 0.0
+        cache = _cache.JsonCache(
+            tmp_path / "cache.json", ttl=60, clock=lambda: now
+        )
+        cache.put("key", "value")
+
+        now = 61.0
+
+        assert cache.get("key") is None
+
+    def test_invalidated_entries_are_absent(self, tmp_path):
+        cache = _cache.JsonCache(tmp_path / "cache.json", ttl=60)
+        cache.put("key", "value")
+
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+
+    def test_cache_dir_follows_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert _cache.cache_dir() == tmp_path / "repobee-feedback"
+
+    def test_save_keeps_entries_saved_by_other_instances(self, tmp_path):
+        """Test that concurrent instances sharing a cache file don't erase
+        each other's entries when saving.
+        """
+        path = tmp_path / "cache.json"
+        first = _cache.JsonCache(path, ttl=60)
+        second = _cache.JsonCache(path, ttl=60)
+        first.put("first", 1)
+        second.put("second", 2)
+
+        first.save()
+        second.save()
+
+        cache = _cache.JsonCache(path, ttl=60)
+        assert cache.get("first") == 1
+        assert cache.get("second") == 2
+
+    def test_save_removes_invalidated_entries_saved_by_others(self, tmp_path):
+        path = tmp_path / "cache.json"
+        first = _cache.JsonCache(path, ttl=60)
+        first.put("key", "value")
+        first.save()
+        second = _cache.JsonCache(path, ttl=60)
+
+        second.invalidate("key")
+        second.save()
+
+        assert _cache.JsonCache(path, ttl=60).get("key") is None
+
+    def test_save_leaves_no_temporary_files(self, tmp_path):
+        cache = _cache.JsonCache(tmp_path / "cache.json", ttl=60)
+        cache.put("key", "value")
+
+        cache.save()
+        cache.save()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["cache.json"]
+
+    def test_save_warns_instead_of_raising_on_write_errors(
+        self, tmp_path, monkeypatch
+    ):
+        cache = _cache.JsonCache(tmp_path / "cache.json", ttl=60)
+        cache.put("key", "value")
+
+        def replace(src, dst):
+            raise FileNotFoundError(src)
+
+        monkeypatch.setattr(_cache.os, "replace", replace)
+        cache.save()
+
+        assert list(tmp_path.iterdir()) == []
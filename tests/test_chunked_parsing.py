@@ -0,0 +1,122 @@
+import sys
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _chunked_parsing
+from repobee_feedback import feedback
+
+ISSUE_TEMPLATE = (
+    "#ISSUE#student{i}-task-1#Feedback {i}\n"
+    "# Test results\n"
+    "\n"
+    "#ISSUE is not a begin issue line\n"
+    "Test case {i} failed.\n"
+    "\n"
+)
+NUM_ISSUES = 50
+
+
+def _write_issues_file(path, newline="\n"):
+    text = "".join(ISSUE_TEMPLATE.format(i=i) for i in range(NUM_ISSUES))
+    path.write_bytes(
+        text.replace("\n", newline).encode(sys.getdefaultencoding())
+    )
+    return path
+
+
+@pytest.fixture
+def issues_file(tmp_path):
+    return _write_issues_file(tmp_path / "issues.md")
+
+
+class TestSplitIntoChunks:
+    """Tests for splitting a multi-issues file into byte ranges."""
+
+    def test_chunks_start_with_begin_issue_lines(self, issues_file):
+        chunks = _chunked_parsing.split_into_chunks(
+            issues_file, 7, feedback._match_begin_issue, min_chunk_size=1
+        )
+
+        content = issues_file.read_bytes()
+        assert len(chunks) == 7
+        assert all(
+            content[start:].startswith(b"#ISSUE#student")
+            for start, _ in chunks
+        )
+
+    def test_chunks_cover_the_whole_file(self, issues_file):
+        chunks = _chunked_parsing.split_into_chunks(
+            issues_file, 7, feedback._match_begin_issue, min_chunk_size=1
+        )
+
+        assert chunks[0][0] == 0
+        assert chunks[-1][1] == issues_file.stat().st_size
+        assert all(
+            end == next_start
+            for (_, end), (next_start, _) in zip(chunks, chunks[1:])
+        )
+
+    def test_small_file_is_a_single_chunk(self, issues_file):
+        chunks = _chunked_parsing.split_into_chunks(
+            issues_file, 7, feedback._match_begin_issue
+        )
+
+        assert chunks == [(0, issues_file.stat().st_size)]
+
+    def test_more_chunks_than_issues(self, tmp_path):
+        issues_file = tmp_path / "issues.md"
+        issues_file.write_text(
+            "#ISSUE#slarse-task-1#Pass\nWell done!\n",
+            encoding=sys.getdefaultencoding(),
+        )
+
+        chunks = _chunked_parsing.split_into_chunks(
+            issues_file, 10, feedback._match_begin_issue, min_chunk_size=1
+        )
+
+        assert chunks == [(0, issues_file.stat().st_size)]
+
+    def test_raises_if_first_line_is_not_begin_issue_line(self, tmp_path):
+        issues_file = tmp_path / "issues.md"
+        issues_file.write_text(
+            "Well done!\n#ISSUE#slarse-task-1#Pass\n",
+            encoding=sys.getdefaultencoding(),
+        )
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            _chunked_parsing.split_into_chunks(
+                issues_file, 2, feedback._match_begin_issue, min_chunk_size=1
+            )
+
+        assert "first line of multi issues file not #ISSUE# line" in str(
+            exc_info.value
+        )
+
+
+class TestParseInChunks:
+    """Tests for parsing a multi-issues file in chunks on several
+    processes.
+    """
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_same_issues_as_sequential_parse(self, tmp_path, newline):
+        issues_file = _write_issues_file(tmp_path / "issues.md", newline)
+
+        issues = list(
+            _chunked_parsing.parse_in_chunks(
+                issues_file,
+                2,
+                feedback._match_begin_issue,
+                feedback._parse_multi_issues_chunk,
+                min_chunk_size=1,
+            )
+        )
+
+        assert len(issues) == NUM_ISSUES
+        assert issues == list(feedback._parse_multi_issues_file(issues_file))
+
+    def test_parse_multi_issues_file_with_processes(self, issues_file):
+        assert list(
+            feedback._parse_multi_issues_file(issues_file, processes=2)
+        ) == list(feedback._parse_multi_issues_file(issues_file))
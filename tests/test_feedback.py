@@ -1,7 +1,13 @@
 import argparse
+import gc
+import json
+import os
 import sys
 import pathlib
 import random
+import subprocess
+import threading
+import weakref
 from unittest import mock
 
 import pytest
@@ -9,6 +15,9 @@ from _repobee import plugin
 import repobee_plug as plug
 
 from repobee_feedback import feedback
+from repobee_feedback._journal import Journal
+from repobee_feedback._lazy_issues import LazyIssue
+from repobee_feedback._sharding import parse_shard, select_shard
 
 ASSIGNMENT_NAMES = ("task-1", "task-2")
 STUDENT_TEAMS = tuple(
@@ -47,11 +56,51 @@ def _write_multi_issues_file(repos_and_issues, path):
             cur += 1
 
 
+def _repo(repo_name: str) -> plug.Repo:
+    return plug.Repo(
+        name=repo_name,
+        description="",
+        private=True,
+        url=f"https://some-host/some-org/{repo_name}",
+        implementation=None,
+    )
+
+
+def _get_repos(repo_urls):
+    return [_repo(url.rsplit("/", 1)[-1]) for url in repo_urls]
+
+
 def test_register():
     """Just test that there is no crash"""
     plugin.register_plugins([feedback])
 
 
+def test_import_only_loads_command_declarations():
+    """Test that importing the plugin, which RepoBee does on every command,
+    doesn't import the modules that implement the commands.
+    """
+    code = "import sys, repobee_feedback.feedback; print(*sys.modules)"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(pathlib.Path(__file__).resolve().parent.parent),
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    plugin_modules = {
+        name
+        for name in proc.stdout.split()
+        if name.startswith("repobee_feedback.")
+    }
+    assert plugin_modules == {
+        "repobee_feedback.__version",
+        "repobee_feedback.feedback",
+        "repobee_feedback._generate_multi_issues_file",
+        "repobee_feedback._merge_reports",
+    }
+
+
 @pytest.fixture
 def parsed_args_issues_dir(tmp_path):
     return argparse.Namespace(
@@ -62,6 +111,29 @@ def parsed_args_issues_dir(tmp_path):
         multi_issues_file=None,
         truncation_length=50,
         allow_missing=False,
+        workers=1,
+        rate_limit=None,
+        max_retries=0,
+        journal=None,
+        resume=False,
+        skip_existing=False,
+        cache_ttl=0,
+        index_multi_issues_file=False,
+        recursive=False,
+        stats=False,
+        stats_file=None,
+        issues_template=None,
+        template_data=None,
+        issues_jsonl=None,
+        issues_archive=None,
+        shard=None,
+        manifest=None,
+        only_changed=False,
+        watch=False,
+        settle_time=0,
+        lazy_bodies=False,
+        update=False,
+        parse_processes=1,
     )
 
 
@@ -76,6 +148,29 @@ def parsed_args_multi_issues_file(with_multi_issues_file):
         multi_issues_file=str(issues_file),
         truncation_length=50,
         allow_missing=False,
+        workers=1,
+        rate_limit=None,
+        max_retries=0,
+        journal=None,
+        resume=False,
+        skip_existing=False,
+        cache_ttl=0,
+        index_multi_issues_file=False,
+        recursive=False,
+        stats=False,
+        stats_file=None,
+        issues_template=None,
+        template_data=None,
+        issues_jsonl=None,
+        issues_archive=None,
+        shard=None,
+        manifest=None,
+        only_changed=False,
+        watch=False,
+        settle_time=0,
+        lazy_bodies=False,
+        update=False,
+        parse_processes=1,
     )
 
 
@@ -183,6 +278,65 @@ class TestCallback:
 
         assert not api_mock.create_issue.called
 
+    def test_approve_all_remaining_opens_issues_after_one_prompt(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that approving all remaining issues in interactive mode opens
+        all issues without prompting for the rest.
+        """
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["batch_mode"] = False
+        args = argparse.Namespace(**args_dict)
+
+        with mock.patch("builtins.input", return_value="a") as input_mock:
+            feedback.callback(args=args, api=api_mock)
+
+        assert input_mock.call_count == 1
+        assert api_mock.create_issue.call_count == len(with_issues)
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_raises_if_workers_is_not_positive(
+        self, with_issues, parsed_args_issues_dir, api_mock, workers
+    ):
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["workers"] = workers
+        args = argparse.Namespace(**args_dict)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback.callback(args=args, api=api_mock)
+
+        assert "number of workers must be positive" in str(exc_info.value)
+        assert not api_mock.create_issue.called
+
+    def test_opens_approved_issues_while_reviewing_the_rest(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that in interactive mode, an approved issue is opened in the
+        background without waiting for the remaining prompts.
+        """
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["batch_mode"] = False
+        args = argparse.Namespace(**args_dict)
+        first_issue_opened = threading.Event()
+        api_mock.create_issue.side_effect = (
+            lambda *args, **kwargs: first_issue_opened.set()
+        )
+        num_prompts = 0
+        opened_during_review = []
+
+        def answer(prompt):
+            nonlocal num_prompts
+            if num_prompts > 0:
+                opened_during_review.append(first_issue_opened.wait(timeout=5))
+            num_prompts += 1
+            return "y"
+
+        with mock.patch("builtins.input", side_effect=answer):
+            feedback.callback(args=args, api=api_mock)
+
+        assert opened_during_review and all(opened_during_review)
+        assert api_mock.create_issue.call_count == len(with_issues)
+
     def test_opens_issues_from_multi_issues_file(
         self, with_multi_issues_file, api_mock, parsed_args_multi_issues_file
     ):
@@ -199,6 +353,69 @@ class TestCallback:
 
         api_mock.create_issue.assert_has_calls(expected_calls)
 
+    def test_opens_issues_rendered_from_template(
+        self, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that the callback opens one issue per expected repo when
+        issues are rendered from a template and data table.
+        """
+        template_file = tmp_path / "template.md"
+        template_file.write_text("Score: $score\nKeep it up!")
+        data_file = tmp_path / "grades.csv"
+        repo_names = plug.generate_repo_names(
+            STUDENT_TEAM_NAMES, ASSIGNMENT_NAMES
+        )
+        data_file.write_text(
+            "repo_name,score\n"
+            + "".join(f"{repo_name},5\n" for repo_name in repo_names)
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["issues_dir"] = None
+        args_dict["issues_template"] = template_file
+        args_dict["template_data"] = data_file
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [mock.call("Score: 5", "Keep it up!", mock.ANY)] * len(repo_names)
+        )
+
+    def test_opens_issues_from_jsonl_file_with_assignees(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that issues are opened from a JSON lines file, and that
+        assignees are passed on to the platform.
+        """
+        issues_file = tmp_path / "issues.jsonl"
+        issues_file.write_text(
+            "\n".join(
+                json.dumps(
+                    dict(
+                        repo_name=repo_name,
+                        title=issue.title,
+                        body=issue.body,
+                        assignees=["ta"],
+                        labels=["feedback"],
+                    )
+                )
+                for repo_name, issue in with_issues
+            )
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["issues_dir"] = None
+        args_dict["issues_jsonl"] = issues_file
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, mock.ANY, assignees=["ta"])
+                for _, issue in with_issues
+            ]
+        )
+
     def test_skips_unexpected_issues_in_multi_issues_file(
         self, with_multi_issues_file, parsed_args_multi_issues_file, api_mock
     ):
@@ -224,6 +441,674 @@ class TestCallback:
 
         api_mock.create_issue.assert_has_calls(expected_calls, any_order=True)
 
+    def test_opens_issues_with_multiple_workers(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that all issues are opened when submission is spread over
+        several worker threads.
+        """
+        expected_calls = [
+            mock.call(issue.title, issue.body, mock.ANY)
+            for repo_name, issue in with_issues
+        ]
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["workers"] = 4
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(expected_calls, any_order=True)
+        assert api_mock.create_issue.call_count == len(with_issues)
+
+    def test_reports_failed_repos_after_opening_the_rest(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that a platform error for one repo does not prevent issues
+        from being opened in the other repos, and that the failed repo is
+        reported at the end.
+        """
+        failing_repo_name = with_issues[0][0]
+
+        def get_repo(repo_name, team_name):
+            if repo_name == failing_repo_name:
+                raise plug.PlatformError("secondary rate limit", status=403)
+            return mock.MagicMock(spec=plug.Repo)
+
+        api_mock.get_repo.side_effect = get_repo
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["workers"] = 2
+        args = argparse.Namespace(**args_dict)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback.callback(args=args, api=api_mock)
+
+        assert failing_repo_name in str(exc_info.value)
+        assert api_mock.create_issue.call_count == len(with_issues) - 1
+
+    def test_resolves_each_repo_once_up_front(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that each repo is looked up once by its URL before issues are
+        opened, such that opening an issue only costs one API call per repo,
+        and every lookup is a separate request to the scheduler.
+        """
+        repo_urls = [
+            f"https://some-host/some-org/{repo_name}"
+            for repo_name, _ in with_issues
+        ]
+        repos = [_repo(repo_name) for repo_name, _ in with_issues]
+        api_mock.get_repo_urls.return_value = repo_urls
+        api_mock.extract_repo_name.side_effect = lambda url: url.rsplit(
+            "/", 1
+        )[-1]
+        api_mock.get_repos.side_effect = _get_repos
+        expected_calls = [
+            mock.call(issue.title, issue.body, repo)
+            for (_, issue), repo in zip(with_issues, repos)
+        ]
+
+        feedback.callback(args=parsed_args_issues_dir, api=api_mock)
+
+        api_mock.get_repos.assert_has_calls(
+            [mock.call([url]) for url in repo_urls], any_order=True
+        )
+        assert api_mock.get_repos.call_count == len(repo_urls)
+        assert not api_mock.get_repo.called
+        api_mock.create_issue.assert_has_calls(expected_calls, any_order=True)
+
+    def test_resolved_repos_are_not_cached_between_runs(
+        self,
+        with_issues,
+        parsed_args_issues_dir,
+        api_mock,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Test that a run with caching enabled writes no cache files, as
+        nothing it fetches without --skip-existing is worth caching.
+        """
+        cache_home = tmp_path / "cache"
+        monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["cache_ttl"] = 600
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        assert not cache_home.exists()
+        assert api_mock.create_issue.call_count == len(with_issues)
+
+    def test_resume_skips_issues_in_journal(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that a resumed run only opens the issues that were not
+        journaled by the interrupted run.
+        """
+        journal_file = tmp_path / "journal.jsonl"
+        num_done = 2
+        done, remaining = with_issues[:num_done], with_issues[num_done:]
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["journal"] = journal_file
+        args_dict["resume"] = True
+        args = argparse.Namespace(**args_dict)
+        api_mock.create_issue.side_effect = (
+            lambda title, body, repo: plug.Issue(title, body, number=1)
+        )
+        interrupted_journal = Journal(journal_file)
+        for repo_name, issue in done:
+            interrupted_journal.append(repo_name, issue, number=1)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, mock.ANY)
+                for _, issue in remaining
+            ],
+            any_order=True,
+        )
+        assert api_mock.create_issue.call_count == len(remaining)
+        assert len(journal_file.read_text().splitlines()) == len(with_issues)
+
+    def test_resume_without_journal_raises(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["resume"] = True
+        args = argparse.Namespace(**args_dict)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback.callback(args=args, api=api_mock)
+
+        assert "--journal" in str(exc_info.value)
+        assert not api_mock.create_issue.called
+
+    def test_skip_existing_skips_issues_that_already_exist(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that issues that already exist in their repos are not opened
+        again with --skip-existing.
+        """
+        (existing_repo_name, existing_issue), *remaining = with_issues
+        repos = {
+            repo_name: mock.MagicMock(spec=plug.Repo)
+            for repo_name, _ in with_issues
+        }
+        api_mock.get_repo.side_effect = lambda repo_name, _: repos[repo_name]
+        api_mock.get_repo_issues.side_effect = lambda repo: (
+            [existing_issue] if repo is repos[existing_repo_name] else []
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["skip_existing"] = True
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        assert api_mock.get_repo_issues.call_count == len(with_issues)
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, repos[repo_name])
+                for repo_name, issue in remaining
+            ],
+            any_order=True,
+        )
+        assert api_mock.create_issue.call_count == len(remaining)
+
+    def test_skip_existing_ignores_line_endings_of_existing_issues(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that an existing issue is recognized even if the platform
+        returns it with CRLF line endings and without the trailing newline of
+        the issue file.
+        """
+        (existing_repo_name, _), *remaining = with_issues
+        _write_issue(
+            plug.Issue(title="Pass", body="Well done!\nFlawless!\n"),
+            tmp_path / f"{existing_repo_name}.md",
+        )
+        existing_issue = plug.Issue(
+            title="Pass", body="Well done!\r\nFlawless!"
+        )
+        api_mock.get_repo.side_effect = lambda repo_name, _: _repo(repo_name)
+        api_mock.get_repo_issues.side_effect = lambda repo: (
+            [existing_issue] if repo.name == existing_repo_name else []
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["skip_existing"] = True
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        assert api_mock.create_issue.call_count == len(remaining)
+        assert all(
+            repo.name != existing_repo_name
+            for (_, _, repo), _ in api_mock.create_issue.call_args_list
+        )
+
+    def test_skip_existing_caches_existing_issues_between_runs(
+        self,
+        with_issues,
+        parsed_args_issues_dir,
+        api_mock,
+        monkeypatch,
+        tmp_path,
+    ):
+        """Test that a second run with --skip-existing neither refetches the
+        existing issues nor reopens the issues opened by the first run.
+        """
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        api_mock.get_repo_issues.return_value = []
+        api_mock.get_repo.side_effect = lambda repo_name, _: _repo(repo_name)
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["skip_existing"] = True
+        args_dict["cache_ttl"] = 60
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+        api_mock.reset_mock()
+        feedback.callback(args=args, api=api_mock)
+
+        assert not api_mock.get_repo_issues.called
+        assert not api_mock.create_issue.called
+
+    def test_writes_stats_file(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that the run statistics are written as JSON with
+        --stats-file.
+        """
+        stats_file = tmp_path / "stats.json"
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["stats_file"] = stats_file
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        stats = json.loads(stats_file.read_text())
+        assert "read issues" in stats["phases"]
+        assert "open issues" in stats["phases"]
+        assert stats["counts"]["issues opened"] == len(with_issues)
+        assert stats["api"]["methods"]["create_issue"]["calls"] == len(
+            with_issues
+        )
+
+    def test_shard_only_opens_issues_for_repos_in_the_shard(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that with --shard, only the repos in the shard are expected
+        to have issues, and only their issues are opened.
+        """
+        shard = parse_shard("1/2")
+        shard_repo_names = set(
+            select_shard((repo_name for repo_name, _ in with_issues), shard)
+        )
+        for repo_name, _ in with_issues:
+            if repo_name not in shard_repo_names:
+                (tmp_path / f"{repo_name}.md").unlink()
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["shard"] = shard
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, mock.ANY)
+                for repo_name, issue in with_issues
+                if repo_name in shard_repo_names
+            ],
+            any_order=True,
+        )
+        assert api_mock.create_issue.call_count == len(shard_repo_names)
+
+    def test_only_changed_opens_only_new_and_changed_issues(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that a second run with --only-changed only opens the issues
+        whose content changed since the first run.
+        """
+        (changed_repo_name, _), (touched_repo_name, touched_issue), *_ = (
+            with_issues
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["manifest"] = tmp_path / "manifest.json"
+        args_dict["only_changed"] = True
+        args = argparse.Namespace(**args_dict)
+        feedback.callback(args=args, api=api_mock)
+        api_mock.reset_mock()
+
+        changed_issue = plug.Issue(title="Changed", body="New feedback")
+        _write_issue(changed_issue, tmp_path / f"{changed_repo_name}.md")
+        # new modification time but same content
+        _write_issue(touched_issue, tmp_path / f"{touched_repo_name}.md")
+        os.utime(tmp_path / f"{touched_repo_name}.md", ns=(0, 0))
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_called_once_with(
+            changed_issue.title, changed_issue.body, mock.ANY
+        )
+
+    def test_only_changed_does_not_read_unchanged_issue_files(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that issue files with the same size and modification time as
+        in the manifest are not read.
+        """
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["manifest"] = tmp_path / "manifest.json"
+        args_dict["only_changed"] = True
+        args = argparse.Namespace(**args_dict)
+        feedback.callback(args=args, api=api_mock)
+        api_mock.reset_mock()
+
+        with mock.patch.object(
+            feedback, "_read_issue", autospec=True
+        ) as read_issue_mock:
+            feedback.callback(args=args, api=api_mock)
+
+        assert not read_issue_mock.called
+        assert not api_mock.create_issue.called
+
+    def test_only_changed_without_manifest_raises(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["only_changed"] = True
+        args = argparse.Namespace(**args_dict)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback.callback(args=args, api=api_mock)
+
+        assert "--manifest" in str(exc_info.value)
+
+    def test_watch_opens_issues_as_issue_files_settle(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that --watch opens the issues of all expected issue files,
+        and stops watching once they have all been opened.
+        """
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["watch"] = True
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, mock.ANY)
+                for repo_name, issue in with_issues
+            ],
+            any_order=True,
+        )
+        assert api_mock.create_issue.call_count == len(with_issues)
+
+    def test_watch_without_batch_mode_raises(
+        self, parsed_args_issues_dir, api_mock
+    ):
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["watch"] = True
+        args_dict["batch_mode"] = False
+        args = argparse.Namespace(**args_dict)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback.callback(args=args, api=api_mock)
+
+        assert "--batch-mode" in str(exc_info.value)
+
+    def test_lazy_bodies_opens_issues_from_multi_issues_file(
+        self,
+        parsed_args_multi_issues_file,
+        with_multi_issues_file,
+        api_mock,
+        monkeypatch,
+        tmp_path,
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        _, repos_and_issues = with_multi_issues_file
+        args_dict = vars(parsed_args_multi_issues_file)
+        args_dict["lazy_bodies"] = True
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, mock.ANY)
+                for _, issue in repos_and_issues
+            ],
+            any_order=True,
+        )
+
+    def test_lazy_bodies_are_released_after_opening(
+        self, with_issues, parsed_args_issues_dir, api_mock, monkeypatch
+    ):
+        """Test that the loaded issues, and the issues returned by the
+        platform, are released once they have been opened, such that at most
+        one issue body per worker is in memory at a time.
+        """
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["lazy_bodies"] = True
+        args = argparse.Namespace(**args_dict)
+        refs = []
+        load = LazyIssue.load
+
+        def load_and_track(self):
+            issue = load(self)
+            refs.append(weakref.ref(issue))
+            return issue
+
+        def create_issue(title, body, repo):
+            # the loaded issue being opened is the only one still alive
+            gc.collect()
+            assert [ref for ref in refs if ref() is not None] == refs[-1:]
+            created = plug.Issue(title=title, body=body)
+            refs.append(weakref.ref(created))
+            return created
+
+        monkeypatch.setattr(LazyIssue, "load", load_and_track)
+        api_mock.create_issue.side_effect = create_issue
+
+        feedback.callback(args=args, api=api_mock)
+
+        assert api_mock.create_issue.call_count == len(with_issues)
+
+    def test_update_edits_changed_issues_and_opens_missing_ones(
+        self, with_issues, parsed_args_issues_dir, api_mock
+    ):
+        """Test that --update edits the previous issue with the same title
+        if its body has changed, skips it if it's unchanged, and opens a new
+        issue in repos without a previous issue.
+        """
+        (
+            (changed_repo_name, changed_issue),
+            (unchanged_repo_name, unchanged_issue),
+            *new,
+        ) = with_issues
+        changed_impl = mock.MagicMock(spec=["edit"])
+        previous_issues = {
+            changed_repo_name: [
+                plug.Issue(
+                    title=changed_issue.title,
+                    body="Typo",
+                    number=1,
+                    implementation=changed_impl,
+                )
+            ],
+            unchanged_repo_name: [
+                plug.Issue(
+                    title=unchanged_issue.title,
+                    body=unchanged_issue.body,
+                    number=1,
+                    implementation=mock.MagicMock(spec=["edit"]),
+                )
+            ],
+        }
+        repos = {
+            repo_name: plug.Repo(
+                name=repo_name,
+                description="",
+                private=True,
+                url=repo_name,
+                implementation=None,
+            )
+            for repo_name, _ in with_issues
+        }
+        api_mock.get_repo.side_effect = lambda repo_name, _: repos[repo_name]
+        api_mock.get_repo_issues.side_effect = (
+            lambda repo: previous_issues.get(repo.name, [])
+        )
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["update"] = True
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        changed_impl.edit.assert_called_once_with(
+            title=changed_issue.title, body=changed_issue.body
+        )
+        api_mock.create_issue.assert_has_calls(
+            [
+                mock.call(issue.title, issue.body, repos[repo_name])
+                for repo_name, issue in new
+            ],
+            any_order=True,
+        )
+        assert api_mock.create_issue.call_count == len(new)
+
+    def test_update_records_edits_in_stats(
+        self, with_issues, parsed_args_issues_dir, api_mock, tmp_path
+    ):
+        """Test that edits made with --update are recorded in the run
+        statistics, although they bypass the platform API.
+        """
+        (changed_repo_name, changed_issue), *new = with_issues
+        previous_issue = plug.Issue(
+            title=changed_issue.title,
+            body="Typo",
+            number=1,
+            implementation=mock.MagicMock(spec=["edit"]),
+        )
+        api_mock.get_repo.side_effect = lambda repo_name, _: _repo(repo_name)
+        api_mock.get_repo_issues.side_effect = lambda repo: (
+            [previous_issue] if repo.name == changed_repo_name else []
+        )
+        stats_file = tmp_path / "stats.json"
+        args_dict = vars(parsed_args_issues_dir)
+        args_dict["update"] = True
+        args_dict["stats_file"] = stats_file
+        args = argparse.Namespace(**args_dict)
+
+        feedback.callback(args=args, api=api_mock)
+
+        methods = json.loads(stats_file.read_text())["api"]["methods"]
+        assert methods["edit_issue"]["calls"] == 1
+        assert methods["create_issue"]["calls"] == len(new)
+
+
+class TestCollectIssues:
+    """Tests for collecting issues from an issues directory."""
+
+    def test_collects_issues_from_nested_directories(self, tmp_path):
+        expected_issues = []
+        for assignment_name in ASSIGNMENT_NAMES:
+            assignment_dir = tmp_path / assignment_name
+            assignment_dir.mkdir()
+            for team_name in STUDENT_TEAM_NAMES:
+                repo_name = plug.generate_repo_name(team_name, assignment_name)
+                issue = random.choice(ISSUES)
+                _write_issue(issue, assignment_dir / f"{repo_name}.md")
+                expected_issues.append((repo_name, issue))
+        repo_names = [repo_name for repo_name, _ in expected_issues]
+
+        issues = feedback._collect_issues(
+            repo_names, tmp_path, recursive=True, workers=2
+        )
+
+        assert issues == expected_issues
+
+    def test_ignores_subdirectories_if_not_recursive(self, tmp_path):
+        (tmp_path / "task-1").mkdir()
+        _write_issue(PASS_ISSUE, tmp_path / "task-1" / "slarse-task-1.md")
+
+        issues = feedback._collect_issues(["slarse-task-1"], tmp_path)
+
+        assert issues == []
+
+    def test_raises_on_duplicate_issue_files(self, tmp_path):
+        for dirname in ("round-1", "round-2"):
+            (tmp_path / dirname).mkdir()
+            _write_issue(PASS_ISSUE, tmp_path / dirname / "slarse-task-1.md")
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            feedback._collect_issues(
+                ["slarse-task-1"], tmp_path, recursive=True
+            )
+
+        assert "multiple issue files" in str(exc_info.value)
+
+    def test_lazy_issues_read_their_bodies_on_access(self, tmp_path):
+        """Test that lazily collected issues have the same titles and bodies
+        as eagerly collected ones, and that the bodies are read from the
+        issue files each time they are accessed.
+        """
+        issue_file = tmp_path / "slarse-task-1.md"
+        _write_issue(PASS_ISSUE, issue_file)
+
+        [(repo_name, issue)] = feedback._collect_issues(
+            ["slarse-task-1"], tmp_path, lazy=True
+        )
+
+        assert repo_name == "slarse-task-1"
+        assert (issue.title, issue.body) == (PASS_ISSUE.title, PASS_ISSUE.body)
+        _write_issue(
+            plug.Issue(title=PASS_ISSUE.title, body="Edited"), issue_file
+        )
+        assert issue.body == "Edited"
+
+    def test_lazy_issues_only_read_bodies_when_accessed(self):
+        """Test that comparing and representing lazy issues does not read
+        their bodies, and that loading them gives issues.
+        """
+        load_body = mock.MagicMock(return_value=PASS_ISSUE.body)
+        issue = LazyIssue(PASS_ISSUE.title, load_body)
+
+        assert issue == issue
+        assert issue != LazyIssue(PASS_ISSUE.title, load_body)
+        assert PASS_ISSUE.title in repr(issue)
+        assert not load_body.called
+        assert issue.load() == PASS_ISSUE
+        assert load_body.call_count == 1
+
+
+class TestParseMultiIssuesFile:
+    """Tests for the multi-issues file parser."""
+
+    def test_parses_issues_in_file_order(self, with_multi_issues_file):
+        issues_file, repos_and_issues = with_multi_issues_file
+
+        parsed = list(feedback._parse_multi_issues_file(issues_file))
+
+        assert parsed == repos_and_issues
+
+    def test_keeps_markdown_headers_in_body(self, tmp_path):
+        issue = plug.Issue(
+            title="Pass", body="# Summary\nGood\n\n## Details\n#ISSUE is ok"
+        )
+        issues_file = tmp_path / "issues.md"
+        _write_multi_issues_file([("slarse-task-1", issue)], issues_file)
+
+        parsed = list(feedback._parse_multi_issues_file(issues_file))
+
+        assert parsed == [("slarse-task-1", issue)]
+
+    def test_indexed_read_matches_full_parse_for_subset(
+        self, with_multi_issues_file, monkeypatch, tmp_path
+    ):
+        """Test that reading a subset of issues through the offset index
+        gives the same issues as filtering a full parse.
+        """
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        issues_file, repos_and_issues = with_multi_issues_file
+        selected_repo_names = [
+            repo_name for repo_name, _ in repos_and_issues[1::2]
+        ]
+
+        indexed = list(
+            feedback._read_indexed_issues(issues_file, selected_repo_names)
+        )
+        cached_indexed = list(
+            feedback._read_indexed_issues(issues_file, selected_repo_names)
+        )
+
+        assert indexed == cached_indexed == repos_and_issues[1::2]
+
+    def test_lazy_indexed_read_matches_full_parse(
+        self, with_multi_issues_file, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        issues_file, repos_and_issues = with_multi_issues_file
+        repo_names = [repo_name for repo_name, _ in repos_and_issues]
+
+        lazy = feedback._read_indexed_issues(
+            issues_file, repo_names, lazy=True
+        )
+
+        assert [
+            (repo_name, issue.title, issue.body) for repo_name, issue in lazy
+        ] == [
+            (repo_name, issue.title, issue.body)
+            for repo_name, issue in repos_and_issues
+        ]
+
+    def test_raises_if_first_line_is_not_issue_line(self, tmp_path):
+        issues_file = tmp_path / "issues.md"
+        issues_file.write_text("Some preamble\n#ISSUE#slarse-task-1#Pass\n")
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            list(feedback._parse_multi_issues_file(issues_file))
+
+        assert "first line" in str(exc_info.value)
+
 
 class TestIndentIssueBody:
     """Tests for the method that addds indentation to the issue body"""
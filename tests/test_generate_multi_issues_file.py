@@ -43,3 +43,34 @@ class TestGenerateMultiIssuesFile:
         content = outfile.read_text(encoding=sys.getdefaultencoding())
         assert outfile.is_file()
         assert content == expected_content
+
+    def test_creates_one_file_per_assignment(self, tmp_path):
+        students = "alice bob".split()
+        assignments = "task-1 task-2".split()
+        command = [
+            *GENERATE_MULTI_ISSUES_FILE_ACTION.as_name_tuple(),
+            "--students",
+            *students,
+            "--assignments",
+            *assignments,
+            "--output",
+            "feedback.md",
+            "--per-assignment",
+        ]
+
+        repobee.run(
+            command,
+            plugins=[GenerateMultiIssuesFile],
+            workdir=tmp_path,
+        )
+
+        for assignment in assignments:
+            outfile = tmp_path / f"feedback-{assignment}.md"
+            content = outfile.read_text(encoding=sys.getdefaultencoding())
+            assert content == (
+                f"#ISSUE#alice-{assignment}#<ISSUE-TITLE>\n"
+                "<ISSUE-BODY>\n\n"
+                f"#ISSUE#bob-{assignment}#<ISSUE-TITLE>\n"
+                "<ISSUE-BODY>"
+            )
+        assert not (tmp_path / MULTI_ISSUES_FILENAME).exists()
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _jsonl_issues
+
+
+class TestReadJsonlIssues:
+    """Tests for reading issues from JSON lines files."""
+
+    def test_body_lines_may_look_like_issue_lines(self, tmp_path):
+        issues_file = tmp_path / "issues.jsonl"
+        body = "#ISSUE#glassey-task-1#Not an issue\nJust a body line"
+        issues_file.write_text(
+            json.dumps(
+                dict(repo_name="slarse-task-1", title="Pass", body=body)
+            )
+            + "\n\n"
+        )
+
+        issues = list(_jsonl_issues.read_jsonl_issues(issues_file))
+
+        assert issues == [
+            (
+                "slarse-task-1",
+                _jsonl_issues.FeedbackIssue(title="Pass", body=body),
+            )
+        ]
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "not json",
+            json.dumps(dict(title="Pass", body="Well done")),
+            json.dumps(dict(repo_name="slarse-task-1", title=["Pass"])),
+            json.dumps(
+                dict(repo_name="slarse-task-1", title="Pass", assignees="ta")
+            ),
+        ],
+    )
+    def test_raises_with_line_number_on_malformed_issue(self, tmp_path, line):
+        issues_file = tmp_path / "issues.jsonl"
+        valid_line = json.dumps(
+            dict(repo_name="glassey-task-1", title="Pass", body="")
+        )
+        issues_file.write_text(f"{valid_line}\n{line}\n")
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            list(_jsonl_issues.read_jsonl_issues(issues_file))
+
+        assert f"{issues_file}:2" in str(exc_info.value)
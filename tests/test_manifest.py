@@ -0,0 +1,61 @@
+import pytest
+
+import repobee_plug as plug
+
+from repobee_feedback._manifest import FileStat, Manifest
+
+ISSUE = plug.Issue(title="Pass", body="Well done!")
+
+
+class TestManifest:
+    """Tests for the manifest of opened issues."""
+
+    def test_recorded_issues_are_unchanged_after_save_and_load(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        file_stat = FileStat(mtime_ns=1, size=2)
+        manifest = Manifest(path)
+        manifest.record("slarse-task-1", ISSUE, file_stat)
+        manifest.record("glassey-task-1", ISSUE)
+        manifest.save()
+
+        loaded = Manifest(path)
+
+        assert loaded.is_unchanged("slarse-task-1", ISSUE)
+        assert loaded.is_unchanged_file("slarse-task-1", file_stat)
+        assert loaded.is_unchanged("glassey-task-1", ISSUE)
+        assert not loaded.is_unchanged_file("glassey-task-1", file_stat)
+        assert not loaded.is_unchanged(
+            "slarse-task-1", plug.Issue(title="Fail", body="Try again")
+        )
+        assert not loaded.is_unchanged("rjglasse-task-1", ISSUE)
+
+    def test_raises_on_malformed_manifest(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text('{"slarse-task-1": {}}')
+
+        with pytest.raises(plug.PlugError):
+            Manifest(path)
+
+    def test_save_keeps_entries_saved_by_other_runs(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        first = Manifest(path)
+        second = Manifest(path)
+        other_issue = plug.Issue(title="Fail", body="Try again")
+
+        first.record("slarse-task-1", ISSUE)
+        second.record("glassey-task-1", other_issue)
+        first.save()
+        second.save()
+
+        loaded = Manifest(path)
+        assert loaded.is_unchanged("slarse-task-1", ISSUE)
+        assert loaded.is_unchanged("glassey-task-1", other_issue)
+
+    def test_save_leaves_no_temporary_files(self, tmp_path):
+        manifest = Manifest(tmp_path / "manifest.json")
+        manifest.record("slarse-task-1", ISSUE)
+
+        manifest.save()
+        manifest.save()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["manifest.json"]
@@ -0,0 +1,60 @@
+import json
+
+import repobee
+import repobee_plug as plug
+
+from repobee_feedback._journal import Journal
+from repobee_feedback._merge_reports import (
+    MERGE_FEEDBACK_REPORTS_ACTION,
+    MergeFeedbackReports,
+)
+from repobee_feedback._stats import RunStats
+
+
+class TestMergeFeedbackReports:
+    """Tests merging the reports of several feedback runs."""
+
+    def test_merges_journals_and_stats_of_shards(self, tmp_path):
+        shard_journals = [
+            tmp_path / "shard-1.jsonl",
+            tmp_path / "shard-2.jsonl",
+        ]
+        shard_stats = [tmp_path / "shard-1.json", tmp_path / "shard-2.json"]
+        for number, (journal_path, stats_path) in enumerate(
+            zip(shard_journals, shard_stats), 1
+        ):
+            Journal(journal_path).append(
+                f"student-{number}-task-1",
+                plug.Issue(title="Pass", body="Well done!"),
+                number,
+            )
+            stats = RunStats()
+            stats.count("issues opened")
+            stats.write(stats_path)
+        output_journal = tmp_path / "journal.jsonl"
+        output_stats = tmp_path / "stats.json"
+        command = [
+            *MERGE_FEEDBACK_REPORTS_ACTION.as_name_tuple(),
+            "--journals",
+            *map(str, shard_journals),
+            "--output-journal",
+            str(output_journal),
+            "--stats-files",
+            *map(str, shard_stats),
+            "--output-stats-file",
+            str(output_stats),
+        ]
+
+        # merging twice must not duplicate journal entries
+        for _ in range(2):
+            repobee.run(
+                command, plugins=[MergeFeedbackReports], workdir=tmp_path
+            )
+
+        entries = Journal(output_journal).read()
+        assert [entry.repo_name for entry in entries] == [
+            "student-1-task-1",
+            "student-2-task-1",
+        ]
+        stats = json.loads(output_stats.read_text())
+        assert stats["counts"] == {"issues opened": 2}
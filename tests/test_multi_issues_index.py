@@ -0,0 +1,69 @@
+import sys
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _multi_issues_index
+from repobee_feedback import feedback
+
+ISSUES_TEXT = (
+    "#ISSUE#slarse-task-1#Pass\n"
+    "Well done!\n"
+    "\n"
+    "#ISSUE#glassey-task-1#Fail\n"
+    "# Errors\n"
+    "Plenty of them.\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def issues_file(tmp_path):
+    path = tmp_path / "issues.md"
+    path.write_bytes(ISSUES_TEXT.encode(sys.getdefaultencoding()))
+    return path
+
+
+class TestLoadIndex:
+    """Tests for loading and building the multi-issues file index."""
+
+    def test_blocks_cover_the_whole_file(self, issues_file):
+        blocks = _multi_issues_index.load_index(
+            issues_file, feedback._match_begin_issue
+        )
+
+        assert [block.repo_name for block in blocks] == [
+            "slarse-task-1",
+            "glassey-task-1",
+        ]
+        assert blocks[0].offset == 0
+        assert blocks[1].offset == blocks[0].length
+        assert sum(block.length for block in blocks) == len(
+            ISSUES_TEXT.encode(sys.getdefaultencoding())
+        )
+
+    def test_index_is_rebuilt_when_file_changes(self, issues_file):
+        _multi_issues_index.load_index(
+            issues_file, feedback._match_begin_issue
+        )
+        with issues_file.open(mode="a") as file:
+            file.write("#ISSUE#grundb-task-1#Pass\nNice\n")
+
+        blocks = _multi_issues_index.load_index(
+            issues_file, feedback._match_begin_issue
+        )
+
+        assert blocks[-1].repo_name == "grundb-task-1"
+
+    def test_raises_if_first_line_is_not_issue_line(self, tmp_path):
+        path = tmp_path / "issues.md"
+        path.write_text("Preamble\n" + ISSUES_TEXT)
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            _multi_issues_index.build_index(path, feedback._match_begin_issue)
+
+        assert "first line" in str(exc_info.value)
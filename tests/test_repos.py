@@ -0,0 +1,147 @@
+from unittest import mock
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _repos
+from repobee_feedback._scheduling import RequestScheduler
+
+BASE_URL = "https://some-host/some-org"
+TEAMS = [plug.StudentTeam(members=[name]) for name in ["ann", "bob", "cid"]]
+REPO_NAME_TO_TEAM = {f"{team.name}-task-1": team for team in TEAMS}
+
+
+def _repo(repo_name: str) -> plug.Repo:
+    return plug.Repo(
+        name=repo_name,
+        description="",
+        private=True,
+        url=f"{BASE_URL}/{repo_name}",
+        implementation=None,
+    )
+
+
+def _get_repos(repo_urls):
+    return [_repo(url.rsplit("/", 1)[-1]) for url in repo_urls]
+
+
+@pytest.fixture
+def api_mock():
+    api = mock.MagicMock(spec=plug.PlatformAPI)
+    api.get_repo_urls.side_effect = lambda _, team_names: [
+        f"{BASE_URL}/{team_name}-task-1" for team_name in team_names
+    ]
+    api.extract_repo_name.side_effect = lambda url: url.rsplit("/", 1)[-1]
+    api.get_repos.side_effect = _get_repos
+    return api
+
+
+class FakeClock:
+    """A clock that only advances when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    return RequestScheduler(
+        clock=clock, sleep=clock.sleep, jitter=lambda low, high: high
+    )
+
+
+def _resolver(api, scheduler, workers=1):
+    return _repos.RepoResolver(
+        api, scheduler, REPO_NAME_TO_TEAM, ["task-1"], workers=workers
+    )
+
+
+class TestRepoResolver:
+    """Tests for the resolver that looks up repos up front."""
+
+    def test_prefetch_looks_up_each_repo_separately(self, api_mock, scheduler):
+        resolver = _resolver(api_mock, scheduler, workers=2)
+
+        resolver.prefetch(REPO_NAME_TO_TEAM)
+
+        assert api_mock.get_repos.call_count == len(REPO_NAME_TO_TEAM)
+        for repo_name in REPO_NAME_TO_TEAM:
+            api_mock.get_repos.assert_any_call([f"{BASE_URL}/{repo_name}"])
+            assert resolver.get(repo_name) == _repo(repo_name)
+        assert not api_mock.get_repo.called
+
+    def test_prefetch_charges_rate_limit_per_repo(self, api_mock, clock):
+        scheduler = RequestScheduler(
+            rate_limit=1, clock=clock, sleep=clock.sleep
+        )
+        resolver = _resolver(api_mock, scheduler)
+
+        resolver.prefetch(REPO_NAME_TO_TEAM)
+
+        # the first lookup is served from the full bucket, the others wait
+        assert clock.now == pytest.approx(len(REPO_NAME_TO_TEAM) - 1)
+
+    def test_prefetch_retries_only_throttled_lookup(
+        self, api_mock, scheduler, clock
+    ):
+        throttled_url = f"{BASE_URL}/{TEAMS[0].name}-task-1"
+        responses = iter(
+            [
+                plug.PlatformError(
+                    "You have exceeded a secondary rate limit", status=403
+                ),
+                [_repo(f"{TEAMS[0].name}-task-1")],
+            ]
+        )
+
+        def get_repos(repo_urls):
+            if repo_urls == [throttled_url]:
+                response = next(responses)
+                if isinstance(response, Exception):
+                    raise response
+                return response
+            return _get_repos(repo_urls)
+
+        api_mock.get_repos.side_effect = get_repos
+        resolver = _resolver(api_mock, scheduler)
+
+        resolver.prefetch(REPO_NAME_TO_TEAM)
+
+        assert clock.sleeps == [1.0]
+        assert api_mock.get_repos.call_count == len(REPO_NAME_TO_TEAM) + 1
+        assert not api_mock.get_repo.called
+
+    def test_repo_that_fails_lookup_is_fetched_on_demand(
+        self, api_mock, scheduler
+    ):
+        failing_repo_name = f"{TEAMS[0].name}-task-1"
+
+        def get_repos(repo_urls):
+            if repo_urls == [f"{BASE_URL}/{failing_repo_name}"]:
+                raise plug.PlatformError("internal error", status=500)
+            return _get_repos(repo_urls)
+
+        api_mock.get_repos.side_effect = get_repos
+        api_mock.get_repo.side_effect = lambda repo_name, _: _repo(repo_name)
+        resolver = _resolver(api_mock, scheduler)
+
+        resolver.prefetch(REPO_NAME_TO_TEAM)
+        repo = resolver.get(failing_repo_name)
+
+        assert repo == _repo(failing_repo_name)
+        api_mock.get_repo.assert_called_once_with(
+            failing_repo_name, TEAMS[0].name
+        )
@@ -0,0 +1,126 @@
+from unittest import mock
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import feedback
+from repobee_feedback._review import IssueReview
+
+ISSUES = [
+    (
+        plug.generate_repo_name(f"student-{i}", assignment),
+        plug.Issue(
+            title="Pass" if i % 2 else "Fail", body=f"Feedback {i}\n" * 20
+        ),
+    )
+    for i in range(15)
+    for assignment in ("task-1", "task-2")
+]
+
+
+def _review(answers, issues=ISSUES, page_size=10):
+    review = IssueReview(
+        issues, 1000, feedback._indent_issue_body, page_size=page_size
+    )
+    with mock.patch("builtins.input", side_effect=answers) as input_mock:
+        decisions = {
+            repo_name: approved
+            for repo_name, _, approved in review.decisions()
+        }
+    return decisions, input_mock.call_count
+
+
+class TestIssueReview:
+    """Tests for the interactive review of issues."""
+
+    def test_prompts_for_each_issue(self):
+        answers = ["y", "n"] * (len(ISSUES) // 2)
+
+        decisions, num_prompts = _review(answers)
+
+        assert num_prompts == len(ISSUES)
+        assert list(decisions.values()) == [
+            answer == "y" for answer in answers
+        ]
+
+    def test_approve_all_remaining(self):
+        decisions, num_prompts = _review(["n", "a"])
+
+        assert num_prompts == 2
+        assert not decisions[ISSUES[0][0]]
+        assert all(decisions[repo_name] for repo_name, _ in ISSUES[1:])
+
+    def test_skip_all_remaining(self):
+        decisions, num_prompts = _review(["q"])
+
+        assert num_prompts == 1
+        assert not any(decisions.values())
+
+    def test_approve_repos_matching_regex(self):
+        """Test that issues in repos that match the regex are approved
+        without prompting, while the others are still prompted for.
+        """
+        num_other = len([r for r, _ in ISSUES if r.endswith("task-1")])
+
+        decisions, num_prompts = _review(
+            ["r task-2$", "n"] + ["n"] * (num_other - 1)
+        )
+
+        assert num_prompts == num_other + 1
+        assert decisions == {
+            repo_name: repo_name.endswith("task-2")
+            for repo_name, _ in ISSUES
+        }
+
+    def test_skip_issues_with_title_of_current_issue(self):
+        num_passed = len([i for _, i in ISSUES if i.title == "Pass"])
+
+        decisions, num_prompts = _review(["t"] + ["y"] * num_passed)
+
+        assert num_prompts == num_passed + 1
+        assert decisions == {
+            repo_name: issue.title == "Pass" for repo_name, issue in ISSUES
+        }
+
+    def test_skip_issues_with_given_title(self):
+        decisions, _ = _review(["t Pass", "a"])
+
+        assert decisions == {
+            repo_name: issue.title == "Fail" for repo_name, issue in ISSUES
+        }
+
+    def test_first_matching_rule_decides(self):
+        decisions, _ = _review(["r student-1-", "q"])
+
+        assert decisions == {
+            repo_name: repo_name.startswith("student-1-")
+            for repo_name, _ in ISSUES
+        }
+
+    def test_lists_remaining_issues_page_by_page(self, capsys):
+        _review(["l", "l", "q"], page_size=3)
+
+        out = capsys.readouterr().out
+        listed = [
+            repo_name for repo_name, _ in ISSUES if f"{repo_name}: " in out
+        ]
+        assert listed == [repo_name for repo_name, _ in ISSUES[:6]]
+        assert "Remaining issues 1-3 of 30:" in out
+        assert "Remaining issues 4-6 of 30:" in out
+        # bodies are truncated in listings
+        assert f"{feedback.INDENTATION_STR}Feedback 0\n" in out
+        assert out.count(feedback.TRUNC_SIGN) == 6
+
+    def test_listing_shows_decided_issues(self, capsys):
+        _review(["t Pass", "l", "n"] + ["n"] * len(ISSUES), page_size=3)
+
+        out = capsys.readouterr().out
+        assert f'{ISSUES[0][0]}: "Fail"\n' in out
+        assert f'{ISSUES[2][0]}: "Pass" (skip)\n' in out
+
+    @pytest.mark.parametrize("answer", ["help", "?", "r", "r ("])
+    def test_prompts_again_after_invalid_command(self, answer, capsys):
+        decisions, num_prompts = _review([answer, "q"])
+
+        assert num_prompts == 2
+        assert not any(decisions.values())
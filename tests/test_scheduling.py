@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _scheduling
+
+
+class FakeClock:
+    """A clock that only advances when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestTokenBucket:
+    """Tests for the token bucket that paces API calls."""
+
+    def test_allows_burst_up_to_capacity(self, clock):
+        bucket = _scheduling.TokenBucket(
+            rate=2, capacity=3, clock=clock, sleep=clock.sleep
+        )
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert not clock.sleeps
+
+    def test_paces_calls_to_rate_after_burst(self, clock):
+        bucket = _scheduling.TokenBucket(
+            rate=4, capacity=1, clock=clock, sleep=clock.sleep
+        )
+
+        for _ in range(5):
+            bucket.acquire()
+
+        assert clock.now == pytest.approx(1.0)
+
+    def test_raises_on_non_positive_rate(self):
+        with pytest.raises(plug.PlugError):
+            _scheduling.TokenBucket(rate=0)
+
+
+class TestRequestScheduler:
+    """Tests for the scheduler that retries throttled requests."""
+
+    def test_retries_throttled_call_with_exponential_backoff(self, clock):
+        func = mock.MagicMock(
+            side_effect=[
+                plug.PlatformError("too many requests", status=429),
+                plug.PlatformError("secondary rate limit", status=403),
+                "created",
+            ]
+        )
+        scheduler = _scheduling.RequestScheduler(
+            max_retries=5,
+            clock=clock,
+            sleep=clock.sleep,
+            jitter=lambda low, high: high,
+        )
+
+        result = scheduler.call(func, "title", body="body")
+
+        assert result == "created"
+        assert func.call_count == 3
+        func.assert_called_with("title", body="body")
+        assert clock.sleeps == [
+            _scheduling.BASE_RETRY_DELAY,
+            2 * _scheduling.BASE_RETRY_DELAY,
+        ]
+
+    def test_does_not_retry_non_throttling_error(self, clock):
+        func = mock.MagicMock(
+            side_effect=plug.PlatformError("forbidden", status=403)
+        )
+        scheduler = _scheduling.RequestScheduler(
+            clock=clock, sleep=clock.sleep
+        )
+
+        with pytest.raises(plug.PlatformError):
+            scheduler.call(func)
+
+        assert func.call_count == 1
+
+    def test_gives_up_after_max_retries(self, clock):
+        func = mock.MagicMock(
+            side_effect=plug.PlatformError("too many requests", status=429)
+        )
+        scheduler = _scheduling.RequestScheduler(
+            max_retries=2, clock=clock, sleep=clock.sleep
+        )
+
+        with pytest.raises(plug.PlatformError):
+            scheduler.call(func)
+
+        assert func.call_count == 3
@@ -0,0 +1,54 @@
+import pytest
+
+import repobee_plug as plug
+
+from repobee_feedback._sharding import (
+    Shard,
+    parse_shard,
+    select_shard,
+    shard_of,
+)
+
+REPO_NAMES = [
+    plug.generate_repo_name(f"student-{i}", assignment)
+    for i in range(50)
+    for assignment in ("task-1", "task-2")
+]
+
+
+class TestParseShard:
+    """Tests for parse_shard."""
+
+    def test_parses_index_and_count(self):
+        assert parse_shard("2/3") == Shard(index=2, count=3)
+
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "3", "a/b", "1/0"])
+    def test_raises_on_invalid_shard(self, value):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+class TestSelectShard:
+    """Tests for select_shard."""
+
+    def test_shards_partition_the_repos(self):
+        """Test that every repo is in exactly one of the shards, and that the
+        repos keep their order within each shard.
+        """
+        num_shards = 4
+        shards = [
+            select_shard(REPO_NAMES, Shard(index, num_shards))
+            for index in range(1, num_shards + 1)
+        ]
+
+        assert sorted(sum(shards, [])) == sorted(REPO_NAMES)
+        assert all(shards)
+        for shard in shards:
+            assert shard == [name for name in REPO_NAMES if name in shard]
+
+    def test_shard_of_is_stable(self):
+        """Test that the shard of a repo doesn't depend on the process, which
+        it would if the built-in hash function was used.
+        """
+        assert shard_of("student-1-task-1", 4) == 3
+        assert shard_of("student-2-task-1", 4) == 2
@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _stats
+
+
+class TestRunStats:
+    """Tests for the run statistics."""
+
+    def test_phase_accumulates_wall_time(self):
+        times = iter([0.0, 1.5, 10.0, 10.5])
+        stats = _stats.RunStats(clock=lambda: next(times))
+
+        with stats.phase("read issues"):
+            pass
+        with stats.phase("read issues"):
+            pass
+
+        assert stats.to_dict()["phases"] == {"read issues": 2.0}
+
+    def test_instrumented_api_records_calls_and_errors(self):
+        api = mock.MagicMock(spec=plug.PlatformAPI)
+        api.get_repo.side_effect = [
+            mock.MagicMock(spec=plug.Repo),
+            plug.NotFoundError("no such repo", status=404),
+        ]
+        stats = _stats.RunStats()
+        instrumented = stats.instrument(api)
+
+        instrumented.get_repo("slarse-task-1", "slarse")
+        with pytest.raises(plug.NotFoundError):
+            instrumented.get_repo("glassey-task-1", "glassey")
+
+        get_repo_stats = stats.to_dict()["api"]["methods"]["get_repo"]
+        assert get_repo_stats["calls"] == 2
+        assert get_repo_stats["errors"] == 1
+        assert sum(get_repo_stats["latency_histogram"]) == 2
+
+    def test_instrumented_api_consumes_lazy_iterables(self):
+        api = mock.MagicMock(spec=plug.PlatformAPI)
+        issues = [plug.Issue(title="Pass", body="Well done!")]
+        api.get_repo_issues.return_value = iter(issues)
+        stats = _stats.RunStats()
+
+        fetched = stats.instrument(api).get_repo_issues(mock.MagicMock())
+
+        assert fetched == issues
+
+    def test_instrumented_api_only_records_requests(self):
+        api = mock.MagicMock(spec=plug.PlatformAPI)
+        api.extract_repo_name.return_value = "slarse-task-1"
+        api.get_repo_urls.return_value = ["https://host/org/slarse-task-1"]
+        stats = _stats.RunStats()
+        instrumented = stats.instrument(api)
+
+        repo_urls = instrumented.get_repo_urls(["task-1"], team_names=[])
+        repo_name = instrumented.extract_repo_name(repo_urls[0])
+        instrumented.get_repos(repo_urls)
+
+        assert repo_name == "slarse-task-1"
+        assert list(stats.to_dict()["api"]["methods"]) == ["get_repos"]
+
+    def test_call_records_calls_and_errors(self):
+        stats = _stats.RunStats()
+
+        def edit_issue(issue, title, body):
+            raise plug.PlatformError("no edits", status=500)
+
+        assert stats.call("edit_issue", lambda: "edited") == "edited"
+        with pytest.raises(plug.PlatformError):
+            stats.call("edit_issue", edit_issue, None, "Pass", "Well done!")
+
+        edit_issue_stats = stats.to_dict()["api"]["methods"]["edit_issue"]
+        assert edit_issue_stats["calls"] == 2
+        assert edit_issue_stats["errors"] == 1
+
+    def test_summary_contains_phases_and_api_calls(self):
+        stats = _stats.RunStats()
+        with stats.phase("open issues"):
+            stats.record_call("create_issue", 0.2, error=False)
+
+        summary = stats.summary()
+
+        assert "open issues" in summary
+        assert "create_issue" in summary
+
+
+class TestMergeStats:
+    """Tests for merging the statistics of several runs."""
+
+    def test_sums_phases_counts_and_api_calls(self):
+        first = _stats.RunStats(clock=iter([0.0, 1.0]).__next__)
+        second = _stats.RunStats(clock=iter([0.0, 2.0]).__next__)
+        for stats, seconds in [(first, 0.2), (second, 3.0)]:
+            with stats.phase("open issues"):
+                stats.record_call("create_issue", seconds, error=False)
+            stats.count("issues opened")
+
+        merged = _stats.merge_stats([first.to_dict(), second.to_dict()])
+
+        assert merged["phases"] == {"open issues": 3.0}
+        assert merged["counts"] == {"issues opened": 2}
+        create_issue_stats = merged["api"]["methods"]["create_issue"]
+        assert create_issue_stats["calls"] == 2
+        assert create_issue_stats["total_seconds"] == pytest.approx(3.2)
+        assert create_issue_stats["max_seconds"] == 3.0
+        assert sum(create_issue_stats["latency_histogram"]) == 2
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback import _templates
+
+TEMPLATE = "Feedback on $assignment: $score/10\nComment: ${comment}\n"
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    path = tmp_path / "template.md"
+    path.write_text(TEMPLATE)
+    return path
+
+
+class TestRenderIssues:
+    """Tests for rendering issues from a template and data table."""
+
+    def test_renders_issues_from_csv(self, template_file, tmp_path):
+        data_file = tmp_path / "grades.csv"
+        data_file.write_text(
+            "repo_name,assignment,score,comment\n"
+            "slarse-task-1,task-1,7,Good\n"
+            'glassey-task-1,task-1,9,"Great, really"\n'
+        )
+
+        issues = list(
+            _templates.render_issues(
+                template_file, data_file, ["slarse-task-1", "glassey-task-1"]
+            )
+        )
+
+        assert issues == [
+            (
+                "slarse-task-1",
+                plug.Issue(
+                    title="Feedback on task-1: 7/10", body="Comment: Good\n"
+                ),
+            ),
+            (
+                "glassey-task-1",
+                plug.Issue(
+                    title="Feedback on task-1: 9/10",
+                    body="Comment: Great, really\n",
+                ),
+            ),
+        ]
+
+    def test_renders_only_expected_repos_from_jsonl(
+        self, template_file, tmp_path
+    ):
+        data_file = tmp_path / "grades.jsonl"
+        rows = [
+            dict(
+                repo_name=f"{student}-task-1",
+                assignment="task-1",
+                score=score,
+                comment=["test_a failed", "test_b failed"],
+            )
+            for student, score in (("slarse", 5), ("glassey", 8))
+        ]
+        data_file.write_text("\n".join(map(json.dumps, rows)))
+
+        issues = list(
+            _templates.render_issues(
+                template_file, data_file, ["glassey-task-1"]
+            )
+        )
+
+        assert issues == [
+            (
+                "glassey-task-1",
+                plug.Issue(
+                    title="Feedback on task-1: 8/10",
+                    body="Comment: test_a failed\ntest_b failed\n",
+                ),
+            )
+        ]
+
+    def test_raises_on_missing_template_variable(
+        self, template_file, tmp_path
+    ):
+        data_file = tmp_path / "grades.csv"
+        data_file.write_text("repo_name,assignment\nslarse-task-1,task-1\n")
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            list(
+                _templates.render_issues(
+                    template_file, data_file, ["slarse-task-1"]
+                )
+            )
+
+        assert "score" in str(exc_info.value)
+        assert "slarse-task-1" in str(exc_info.value)
+
+    def test_reads_csv_with_byte_order_mark(self, template_file, tmp_path):
+        data_file = tmp_path / "grades.csv"
+        data_file.write_bytes(
+            "repo_name,assignment,score,comment\n"
+            "slarse-task-1,task-1,7,Good\n".encode("utf-8-sig")
+        )
+
+        issues = list(
+            _templates.render_issues(
+                template_file, data_file, ["slarse-task-1"]
+            )
+        )
+
+        assert [repo_name for repo_name, _ in issues] == ["slarse-task-1"]
+
+    @pytest.mark.parametrize("line", ["[1, 2]", '"x"', "42"])
+    def test_raises_on_jsonl_line_that_is_not_an_object(
+        self, template_file, tmp_path, line
+    ):
+        data_file = tmp_path / "grades.jsonl"
+        data_file.write_text(
+            json.dumps(dict(repo_name="slarse-task-1")) + "\n" + line + "\n"
+        )
+
+        with pytest.raises(plug.PlugError) as exc_info:
+            list(
+                _templates.render_issues(
+                    template_file, data_file, ["glassey-task-1"]
+                )
+            )
+
+        assert f"{data_file}:2: expected a JSON object" in str(exc_info.value)
@@ -0,0 +1,108 @@
+from unittest import mock
+
+import pytest
+import repobee_plug as plug
+
+from repobee_feedback._journal import Journal
+from repobee_feedback._updates import (
+    IssueUpdater,
+    edit_issue,
+    issue_numbers_from_journal,
+)
+
+REPO_NAME = "slarse-task-1"
+
+
+def _issue(number, title="Feedback", body="Well done!", implementation=None):
+    return plug.Issue(
+        title=title, body=body, number=number, implementation=implementation
+    )
+
+
+class TestIssueUpdater:
+    """Tests for finding the issues to update."""
+
+    def test_finds_most_recent_issue_with_same_title(self):
+        issues = [_issue(1), _issue(3), _issue(2), _issue(4, title="Other")]
+        updater = IssueUpdater()
+        updater.fetch([REPO_NAME], lambda _: issues, workers=1)
+
+        assert updater.find(REPO_NAME, "Feedback").number == 3
+        assert updater.find(REPO_NAME, "Missing") is None
+
+    def test_prefers_issue_with_number_from_journal(self, tmp_path):
+        """Test that of several issues with the same title, the one whose
+        number is in the journal is updated.
+        """
+        journal = Journal(tmp_path / "journal.jsonl")
+        journal.append(REPO_NAME, _issue(None), number=1)
+        updater = IssueUpdater(issue_numbers_from_journal(journal))
+        updater.fetch([REPO_NAME], lambda _: [_issue(1), _issue(2)], 1)
+
+        assert updater.find(REPO_NAME, "Feedback").number == 1
+
+    def test_finds_issue_with_same_title_among_feedback_issues(self, tmp_path):
+        """Test that with several feedback issues in a repo, each is only
+        updated by an issue with its own title, even if the journal has the
+        number of another one.
+        """
+        week_1 = _issue(1, title="Week 1")
+        week_2 = _issue(2, title="Week 2")
+        journal = Journal(tmp_path / "journal.jsonl")
+        journal.append(REPO_NAME, week_1, number=1)
+        journal.append(REPO_NAME, week_2, number=2)
+        updater = IssueUpdater(issue_numbers_from_journal(journal))
+        updater.fetch([REPO_NAME], lambda _: [week_1, week_2], 1)
+
+        assert updater.find(REPO_NAME, "Week 1") == week_1
+        assert updater.find(REPO_NAME, "Week 2") == week_2
+        assert updater.find(REPO_NAME, "Week 3") is None
+        assert not updater.is_unchanged(
+            REPO_NAME, _issue(None, title="Week 1", body="Fixed typo")
+        )
+
+    def test_unchanged_ignores_line_endings_and_trailing_whitespace(self):
+        updater = IssueUpdater()
+        updater.fetch(
+            [REPO_NAME], lambda _: [_issue(1, body="Line 1\r\nLine 2\n")], 1
+        )
+
+        assert updater.is_unchanged(
+            REPO_NAME, _issue(None, body="Line 1\nLine 2")
+        )
+        assert not updater.is_unchanged(REPO_NAME, _issue(None, body="Line 1"))
+
+
+class TestEditIssue:
+    """Tests for editing issues through the platform issue objects."""
+
+    def test_edits_github_issue(self):
+        impl = mock.MagicMock(spec=["edit"])
+
+        edited = edit_issue(_issue(1, implementation=impl), "New", "Body")
+
+        impl.edit.assert_called_once_with(title="New", body="Body")
+        assert (edited.number, edited.title, edited.body) == (1, "New", "Body")
+
+    def test_edits_gitlab_issue(self):
+        impl = mock.MagicMock(spec=["title", "description", "save"])
+
+        edit_issue(_issue(1, implementation=impl), "New", "Body")
+
+        assert (impl.title, impl.description) == ("New", "Body")
+        impl.save.assert_called_once_with()
+
+    def test_wraps_platform_errors(self):
+        error = Exception("rate limited")
+        error.status = 403
+        impl = mock.MagicMock(spec=["edit"])
+        impl.edit.side_effect = error
+
+        with pytest.raises(plug.PlatformError) as exc_info:
+            edit_issue(_issue(1, implementation=impl), "New", "Body")
+
+        assert exc_info.value.status == 403
+
+    def test_raises_if_issue_cannot_be_edited(self):
+        with pytest.raises(plug.PlatformError):
+            edit_issue(_issue(1), "New", "Body")
@@ -0,0 +1,80 @@
+import os
+from unittest import mock
+
+from repobee_feedback import _watch
+
+REPO_NAMES = ["slarse-task-1", "glassey-task-1"]
+
+
+def _find_issue_files(issues_dir):
+    def find(repo_names):
+        return {
+            repo_name: issues_dir / f"{repo_name}.md"
+            for repo_name in repo_names
+            if (issues_dir / f"{repo_name}.md").is_file()
+        }
+
+    return find
+
+
+class TestWatchIssueFiles:
+    """Tests for watching an issues directory."""
+
+    def test_yields_issue_files_once_they_have_settled(self, tmp_path):
+        """Test that each issue file is yielded once it has been unchanged
+        for the settle time, and that watching stops when all expected
+        issue files have been yielded.
+        """
+        now = 0.0
+        # the grader writes one file, appends to it, and then writes another
+        writes = iter(
+            [
+                (REPO_NAMES[0], "Pass\n"),
+                (REPO_NAMES[0], "Pass\nWell done!"),
+                (REPO_NAMES[1], "Fail\nTry again"),
+            ]
+        )
+
+        def wait(timeout):
+            nonlocal now
+            now += 1.0
+            write = next(writes, None)
+            if write is not None:
+                repo_name, text = write
+                path = tmp_path / f"{repo_name}.md"
+                path.write_text(text)
+                # make sure that each write changes the modification time
+                mtime_ns = int(now * 1e9)
+                os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        issue_files = _watch.watch_issue_files(
+            tmp_path,
+            REPO_NAMES,
+            _find_issue_files(tmp_path),
+            settle_time=2.0,
+            clock=lambda: now,
+            wait=wait,
+        )
+
+        assert [(name, now) for name, _, _ in issue_files] == [
+            (REPO_NAMES[0], 4.0),
+            (REPO_NAMES[1], 5.0),
+        ]
+
+    def test_ignores_unexpected_issue_files(self, tmp_path):
+        (tmp_path / "rjglasse-task-1.md").write_text("Pass\nWell done!")
+        (tmp_path / f"{REPO_NAMES[0]}.md").write_text("Pass\nWell done!")
+        wait = mock.MagicMock()
+
+        issue_files = list(
+            _watch.watch_issue_files(
+                tmp_path,
+                REPO_NAMES[:1],
+                _find_issue_files(tmp_path),
+                settle_time=0,
+                wait=wait,
+            )
+        )
+
+        assert [name for name, _, _ in issue_files] == REPO_NAMES[:1]
+        wait.assert_called_once_with(0)